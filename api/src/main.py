@@ -1,12 +1,16 @@
 """Claude Explorer REST API - FastAPI Application."""
 
+import asyncio
 import os
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fast_llms_txt import create_llms_txt_router
 
-from .routes.activity import router as global_activity_router
+from .routes.activity import router as global_activity_router, run_activity_prefetch
 from .routes.commands import router as commands_router
 from .routes.config import router as config_router
 from .routes.correlated import router as correlated_router
@@ -23,7 +27,21 @@ from .routes.projects import (
 )
 from .routes.shell_snapshots import router as shell_snapshots_router
 from .routes.skills import router as skills_router
-from .routes.stats import router as stats_router
+from .routes.stats import router as stats_router, run_stats_refresh
+from .session_index import warm_session_index
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the session index and keep activity windows and stats precomputed, in the background."""
+    index_task = asyncio.create_task(warm_session_index())
+    prefetch_task = asyncio.create_task(run_activity_prefetch())
+    stats_task = asyncio.create_task(run_stats_refresh())
+    yield
+    index_task.cancel()
+    prefetch_task.cancel()
+    stats_task.cancel()
+
 
 app = FastAPI(
     title="Claude Explorer API",
@@ -32,6 +50,8 @@ app = FastAPI(
     docs_url="/api/v1/docs",
     redoc_url="/api/v1/redoc",
     openapi_url="/api/v1/openapi.json",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -41,8 +61,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Backup-Name", "X-Backup-Size"],
 )
 
+# Compress larger JSON payloads (session lists, stats) for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 # API v1 prefix
 API_PREFIX = "/api/v1"
 
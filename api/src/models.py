@@ -2,7 +2,9 @@
 
 from datetime import datetime
 from typing import Any, Generic, TypeVar
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+
+from .utils import redact_sensitive_data
 
 T = TypeVar("T")
 
@@ -909,6 +911,13 @@ class ClaudeConfig(BaseModel):
     """
     model_config = {"extra": "allow"}  # Allow any fields since config is dynamic
 
+    @model_validator(mode="after")
+    def redact_sensitive_fields(self) -> "ClaudeConfig":
+        """Redact sensitive data while the config is being validated."""
+        if self.__pydantic_extra__:
+            self.__pydantic_extra__.update(redact_sensitive_data(self.__pydantic_extra__))
+        return self
+
 
 # Settings
 class ClaudeSettings(BaseModel):
@@ -4,11 +4,16 @@ These endpoints aggregate session activity across all projects,
 supporting date range filtering and summary statistics.
 """
 
-from datetime import datetime, timezone
-from pathlib import Path
+import asyncio
+import heapq
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from itertools import groupby
 from typing import Literal
 
 from fastapi import APIRouter, Query
+from fastapi.responses import ORJSONResponse
 
 from ..models import (
     ActivitySummaryStats,
@@ -19,19 +24,60 @@ from ..models import (
     GlobalDailyActivity,
     ProjectBreakdown,
 )
+from ..session_index import get_index_generation, query_sessions, refresh_session_index
 from ..utils import (
-    build_path_lookup,
-    encode_project_path,
-    get_claude_config,
     get_claude_dir,
     get_parent_session_id,
+    get_path_lookup,
     get_project_name,
-    parse_timestamp,
 )
-from .projects import get_session_bounds, get_session_files
 
 router = APIRouter(prefix="/activity", tags=["activity"])
 
+logger = logging.getLogger(__name__)
+
+# Windows dashboards request most often (today, last 7 days, last 30 days),
+# precomputed in the background as (index generation, activity). A window is
+# only served while the session index is unchanged since it was built.
+PREFETCH_WINDOW_DAYS = (0, 7, 30)
+PREFETCH_INTERVAL_SECONDS = 60
+_prefetched_activity: dict[tuple[str, str, str], tuple[int, dict]] = {}
+
+
+async def prefetch_common_windows() -> None:
+    """Precompute global activity for the common dashboard windows."""
+    today = datetime.now(timezone.utc).date()
+    prefetched = {}
+
+    # One refresh serves every window in the pass
+    await refresh_session_index()
+    generation = get_index_generation()
+    for days in PREFETCH_WINDOW_DAYS:
+        start_date = (today - timedelta(days=days)).isoformat()
+        end_date = today.isoformat()
+        prefetched[(start_date, end_date, "all")] = (
+            generation,
+            await build_global_activity(start_date, end_date, "all", refresh=False),
+        )
+
+    _prefetched_activity.clear()
+    _prefetched_activity.update(prefetched)
+
+
+async def run_activity_prefetch() -> None:
+    """Refresh the prefetched activity windows until cancelled.
+
+    A failed pass is logged and drops the prefetched windows, so requests
+    compute activity directly until the next pass succeeds.
+    """
+    while True:
+        try:
+            await prefetch_common_windows()
+        except Exception:
+            logger.exception("Failed to prefetch global activity")
+            _prefetched_activity.clear()
+        await asyncio.sleep(PREFETCH_INTERVAL_SECONDS)
+
 
 @router.get(
     "/",
@@ -67,14 +113,37 @@ async def get_global_activity(
     ),
 ) -> GlobalActivityResponse:
     """Get activity across all projects for a date range."""
+    # Prefetched windows are only as fresh as the index they were built from,
+    # so they are served only when this refresh finds nothing new
+    await refresh_session_index()
+    prefetched = _prefetched_activity.get((start_date, end_date, type))
+    if prefetched and prefetched[0] == get_index_generation():
+        activity = prefetched[1]
+    else:
+        activity = await build_global_activity(start_date, end_date, type, refresh=False)
+
+    # The payload is built field-for-field in the response schema, so it is
+    # sent as-is instead of being revalidated session by session
+    return ORJSONResponse(activity)
+
+
+async def build_global_activity(
+    start_date: str,
+    end_date: str,
+    type: Literal["regular", "agent", "all"],
+    refresh: bool = True,
+) -> dict:
+    """Build the cross-project activity timeline for a date range.
+
+    refresh=False skips refreshing the session index, for callers that just did.
+    """
     # Parse date bounds
     start_dt = datetime.strptime(start_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
     end_dt = datetime.strptime(end_date, "%Y-%m-%d").replace(
         hour=23, minute=59, second=59, tzinfo=timezone.utc
     )
 
-    config = await get_claude_config()
-    path_lookup = build_path_lookup(config)
+    path_lookup = await get_path_lookup()
     projects_dir = get_claude_dir() / "projects"
 
     if not projects_dir.exists():
@@ -87,59 +156,40 @@ async def get_global_activity(
             },
         }
 
-    # Collect sessions from all projects
+    # Collect sessions from all projects via the session index
     all_sessions = []
+    rows = await query_sessions(start_dt, end_dt, type, refresh)
 
-    for project_dir in projects_dir.iterdir():
-        if not project_dir.is_dir():
-            continue
-
-        project_id = project_dir.name
+    for project_id, project_rows in groupby(rows, key=lambda r: r["project_id"]):
+        project_dir = projects_dir / project_id
         real_path = path_lookup.get(project_id)
         project_name = get_project_name(real_path) if real_path else project_id
 
-        session_files = await get_session_files(project_id)
         project_sessions = []
         project_agent_sessions = []
 
-        for file in session_files:
-            session_id = file["name"].replace(".jsonl", "")
-            bounds = await get_session_bounds(project_id, file["name"])
-
-            if not bounds["start_time"]:
-                continue
-
-            # Filter by date range
-            if bounds["start_time"] < start_dt or bounds["start_time"] > end_dt:
-                continue
-
-            is_sub_agent = session_id.startswith("agent-")
-
-            # Filter by type
-            if type == "regular" and is_sub_agent:
-                continue
-            if type == "agent" and not is_sub_agent:
-                continue
+        for row in project_rows:
+            session_id = row["session_id"]
+            is_sub_agent = row["is_agent"]
 
             session = {
                 "id": session_id,
                 "projectPath": real_path or project_id,
-                "projectId": project_id,
-                "projectName": project_name,
-                "startTime": bounds["start_time"],
-                "endTime": bounds["end_time"],
-                "messageCount": bounds["message_count"],
-                "model": bounds.get("model"),
+                "startTime": row["start_time"],
+                "endTime": row["end_time"],
+                "messageCount": row["message_count"],
+                "model": row["model"],
                 "isSubAgent": is_sub_agent,
                 "parentSessionId": None,
                 "subAgentIds": None,
+                "projectId": project_id,
+                "projectName": project_name,
             }
             project_sessions.append(session)
             if is_sub_agent:
                 project_agent_sessions.append(session)
 
         # Populate parent-child relationships for this project
-        from collections import defaultdict
         parent_to_agents: dict[str, list[str]] = defaultdict(list)
 
         for agent in project_agent_sessions:
@@ -159,7 +209,7 @@ async def get_global_activity(
     daily_map: dict[str, dict] = {}
 
     for session in all_sessions:
-        date_str = session["startTime"].strftime("%Y-%m-%d")
+        date_str = session["startTime"][:10]  # YYYY-MM-DD prefix of ISO 8601
         if date_str not in daily_map:
             daily_map[date_str] = {"sessions": [], "total_messages": 0}
 
@@ -171,14 +221,7 @@ async def get_global_activity(
     for date, data in sorted(daily_map.items(), reverse=True):
         daily_activity.append({
             "date": date,
-            "sessions": [
-                {
-                    **s,
-                    "startTime": s["startTime"].isoformat(),
-                    "endTime": s["endTime"].isoformat() if s["endTime"] else None,
-                }
-                for s in data["sessions"]
-            ],
+            "sessions": data["sessions"],
             "totalMessages": data["total_messages"],
             "sessionCount": len(data["sessions"]),
         })
@@ -230,6 +273,12 @@ async def get_activity_summary(
         "all",
         description="Filter by session type: 'regular' (main sessions only), 'agent' (sub-agents only), or 'all' (both)"
     ),
+    top_n: int | None = Query(
+        None,
+        alias="topN",
+        ge=1,
+        description="Only include the N projects with the most messages in projectBreakdown. Omit for all projects."
+    ),
 ) -> GlobalActivitySummary:
     """Get aggregated activity summary across all projects."""
     # Parse date bounds
@@ -238,8 +287,7 @@ async def get_activity_summary(
         hour=23, minute=59, second=59, tzinfo=timezone.utc
     )
 
-    config = await get_claude_config()
-    path_lookup = build_path_lookup(config)
+    path_lookup = await get_path_lookup()
     projects_dir = get_claude_dir() / "projects"
 
     if not projects_dir.exists():
@@ -257,58 +305,43 @@ async def get_activity_summary(
     total_sessions = 0
     total_messages = 0
 
-    for project_dir in projects_dir.iterdir():
-        if not project_dir.is_dir():
-            continue
-
-        project_id = project_dir.name
-        real_path = path_lookup.get(project_id)
-        project_name = get_project_name(real_path) if real_path else project_id
-
-        session_files = await get_session_files(project_id)
-
-        for file in session_files:
-            session_id = file["name"].replace(".jsonl", "")
-            bounds = await get_session_bounds(project_id, file["name"])
-
-            if not bounds["start_time"]:
-                continue
-
-            # Filter by date range
-            if bounds["start_time"] < start_dt or bounds["start_time"] > end_dt:
-                continue
-
-            is_sub_agent = session_id.startswith("agent-")
-
-            # Filter by type
-            if type == "regular" and is_sub_agent:
-                continue
-            if type == "agent" and not is_sub_agent:
-                continue
-
-            msg_count = bounds["message_count"]
-
-            # Update project stats
-            if project_id not in project_stats:
-                project_stats[project_id] = {
-                    "name": project_name,
-                    "sessions": 0,
-                    "messages": 0,
-                }
-            project_stats[project_id]["sessions"] += 1
-            project_stats[project_id]["messages"] += msg_count
+    for row in await query_sessions(start_dt, end_dt, type):
+        project_id = row["project_id"]
+        msg_count = row["message_count"]
+
+        # Update project stats
+        if project_id not in project_stats:
+            real_path = path_lookup.get(project_id)
+            project_stats[project_id] = {
+                "name": get_project_name(real_path) if real_path else project_id,
+                "sessions": 0,
+                "messages": 0,
+            }
+        project_stats[project_id]["sessions"] += 1
+        project_stats[project_id]["messages"] += msg_count
 
-            # Update daily stats
-            date_str = bounds["start_time"].strftime("%Y-%m-%d")
-            if date_str not in daily_stats:
-                daily_stats[date_str] = {"sessions": 0, "messages": 0}
-            daily_stats[date_str]["sessions"] += 1
-            daily_stats[date_str]["messages"] += msg_count
+        # Update daily stats
+        date_str = row["start_time"][:10]  # YYYY-MM-DD prefix of ISO 8601
+        if date_str not in daily_stats:
+            daily_stats[date_str] = {"sessions": 0, "messages": 0}
+        daily_stats[date_str]["sessions"] += 1
+        daily_stats[date_str]["messages"] += msg_count
 
-            total_sessions += 1
-            total_messages += msg_count
+        total_sessions += 1
+        total_messages += msg_count
 
     # Build breakdowns
+    if top_n is not None:
+        ranked_projects = heapq.nlargest(
+            top_n, project_stats.items(), key=lambda x: x[1]["messages"]
+        )
+    else:
+        ranked_projects = sorted(
+            project_stats.items(),
+            key=lambda x: x[1]["messages"],
+            reverse=True
+        )
+
     project_breakdown = [
         {
             "project": stats["name"],
@@ -316,11 +349,7 @@ async def get_activity_summary(
             "sessions": stats["sessions"],
             "messages": stats["messages"],
         }
-        for pid, stats in sorted(
-            project_stats.items(),
-            key=lambda x: x[1]["messages"],
-            reverse=True
-        )
+        for pid, stats in ranked_projects
     ]
 
     daily_breakdown = [
@@ -4,6 +4,7 @@ Commands are simple slash commands stored as markdown files with YAML
 frontmatter. Invoked with /command-name.
 """
 
+import asyncio
 from urllib.parse import unquote
 
 from fastapi import APIRouter, HTTPException, Path
@@ -19,7 +20,7 @@ async def get_command_info(file_path, name: str) -> dict:
     command = {"name": name}
 
     try:
-        content = file_path.read_text()
+        content = await asyncio.to_thread(file_path.read_text)
         frontmatter = parse_yaml_frontmatter(content)
         if frontmatter.get("description"):
             command["description"] = frontmatter["description"]
@@ -5,9 +5,10 @@ Provides read-only access to Claude Code configuration:
 - User settings: Permissions, hooks, model selection
 """
 
-import json
+import asyncio
 from typing import Any
 
+import orjson
 from fastapi import APIRouter
 
 from ..models import ClaudeConfig, ClaudeSettings
@@ -15,34 +16,9 @@ from ..utils import get_claude_config_path, get_claude_dir
 
 router = APIRouter(prefix="/config", tags=["config"])
 
-# Sensitive fields to redact from config
-SENSITIVE_FIELDS = [
-    "oauthaccount",
-    "accesstoken",
-    "refreshtoken",
-    "apikey",
-    "credentials",
-    "token",
-    "secret",
-]
-
-
-def redact_sensitive_data(obj: dict[str, Any]) -> dict[str, Any]:
-    """Redact sensitive data from a dictionary."""
-    result = {}
-
-    for key, value in obj.items():
-        # Check if key is sensitive
-        is_sensitive = any(field in key.lower() for field in SENSITIVE_FIELDS)
-
-        if is_sensitive:
-            result[key] = "[REDACTED]"
-        elif isinstance(value, dict):
-            result[key] = redact_sensitive_data(value)
-        else:
-            result[key] = value
-
-    return result
+# Parsed config/settings cached as (mtime_ns, data); reparsed when the file changes
+_config_cache: tuple[int, ClaudeConfig] | None = None
+_settings_cache: tuple[int, dict[str, Any]] | None = None
 
 
 @router.get("/", response_model=ClaudeConfig)
@@ -61,11 +37,20 @@ async def get_config() -> ClaudeConfig:
     Returns:
         ClaudeConfig object (dynamic fields allowed)
     """
+    global _config_cache
+
     try:
         config_path = get_claude_config_path()
-        content = config_path.read_text()
-        config = json.loads(content)
-        return redact_sensitive_data(config)
+        mtime_ns = config_path.stat().st_mtime_ns
+        if _config_cache and _config_cache[0] == mtime_ns:
+            return _config_cache[1]
+
+        # Sensitive fields are redacted by ClaudeConfig's validator
+        config = ClaudeConfig.model_validate_json(
+            await asyncio.to_thread(config_path.read_bytes)
+        )
+        _config_cache = (mtime_ns, config)
+        return config
     except Exception:
         return {}
 
@@ -85,10 +70,17 @@ async def get_settings() -> ClaudeSettings:
     Returns:
         ClaudeSettings object (dynamic fields allowed)
     """
+    global _settings_cache
+
     try:
         claude_dir = get_claude_dir()
         settings_path = claude_dir / "settings.json"
-        content = settings_path.read_text()
-        return json.loads(content)
+        mtime_ns = settings_path.stat().st_mtime_ns
+        if _settings_cache and _settings_cache[0] == mtime_ns:
+            return _settings_cache[1]
+
+        settings = orjson.loads(await asyncio.to_thread(settings_path.read_bytes))
+        _settings_cache = (mtime_ns, settings)
+        return settings
     except Exception:
         return {}
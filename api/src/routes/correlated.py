@@ -5,94 +5,208 @@ The session UUID is the universal key linking: transcripts, file backups,
 todos, environment variables, and debug logs.
 """
 
-import json
+import asyncio
+import itertools
+import mmap
+import os
+import re
+import stat
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from urllib.parse import unquote
+from urllib.parse import quote, unquote
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Query
 from fastapi import Path as PathParam
+from fastapi.responses import FileResponse
 
 from ..models import (
     FileBackupContent,
     FilesChangedResponse,
     TodoItem,
 )
-from ..utils import get_claude_dir, get_parent_session_id, parse_jsonl_file
+from ..session_index import lookup_session_project
+from ..utils import get_claude_dir, get_claude_dir_resolved, get_parent_session_id, iter_jsonl_file, ttl_cache
 
 router = APIRouter(prefix="/sessions", tags=["correlated"])
 
+# How long lookup results are reused across the requests of one page render
+LOOKUP_TTL_SECONDS = 3.0
 
-async def find_session_transcript(session_id: str) -> Path | None:
+# Per-file reads fan out on their own bounded pool, so a session with
+# hundreds of agent transcripts can't starve the default to_thread executor
+_file_read_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="correlated-read")
+
+
+def _read_in_pool(func, *args):
+    """Run a blocking per-file read on the file-read pool."""
+    return asyncio.get_running_loop().run_in_executor(_file_read_executor, func, *args)
+
+# Data directories, resolved once at import
+_CLAUDE_DIR = get_claude_dir()
+_PROJECTS_DIR = _CLAUDE_DIR / "projects"
+_TODOS_DIR = _CLAUDE_DIR / "todos"
+_DEBUG_DIR = _CLAUDE_DIR / "debug"
+_FILE_HISTORY_DIR = _CLAUDE_DIR / "file-history"
+_PLANS_DIR = _CLAUDE_DIR / "plans"
+_SESSION_ENV_DIR = _CLAUDE_DIR / "session-env"
+
+# Cached directory listings keyed by path: (mtime_ns, entries, entries bucketed
+# by the first SESSION_PREFIX_LEN characters of their name). A directory's mtime
+# changes whenever entries are added, removed or renamed, so a matching mtime
+# means the cached listing is still accurate.
+SESSION_PREFIX_LEN = 8
+_dir_listings: dict[str, tuple[int, list[os.DirEntry], dict[str, list[os.DirEntry]]]] = {}
+
+
+def _list_dir(directory: Path) -> tuple[list[os.DirEntry], dict[str, list[os.DirEntry]]]:
+    """Get a directory's entries and prefix buckets, rescanning only if it changed."""
+    key = str(directory)
+    mtime_ns = os.stat(key).st_mtime_ns
+
+    cached = _dir_listings.get(key)
+    if cached and cached[0] == mtime_ns:
+        return cached[1], cached[2]
+
+    with os.scandir(key) as it:
+        entries = list(it)
+
+    buckets: dict[str, list[os.DirEntry]] = defaultdict(list)
+    for entry in entries:
+        buckets[entry.name[:SESSION_PREFIX_LEN]].append(entry)
+
+    _dir_listings[key] = (mtime_ns, entries, buckets)
+    return entries, buckets
+
+
+# Session IDs referenced by each plan: {filename: (mtime_ns, session_ids)}
+SESSION_ID_RE = re.compile(rb"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+# Plans at least this large are scanned through mmap rather than read into memory
+PLAN_MMAP_MIN_BYTES = 4096
+_plan_session_ids: dict[str, tuple[int, frozenset[str]]] = {}
+_plan_index: dict[str, str] = {}
+# Lookups run in worker threads; refreshing and reading both indexes holds this lock
+_plan_index_lock = threading.Lock()
+
+
+def _find_session_entries(directory: Path, session_id: str) -> list[os.DirEntry]:
+    """Get entries in a directory whose name starts with a session ID."""
+    entries, buckets = _list_dir(directory)
+    if len(session_id) >= SESSION_PREFIX_LEN:
+        entries = buckets.get(session_id[:SESSION_PREFIX_LEN], [])
+    return [entry for entry in entries if entry.name.startswith(session_id)]
+
+
+# Resolved transcript paths by session ID, revalidated with a stat on each hit
+_transcript_paths: dict[str, Path] = {}
+
+
+def _find_session_transcript(session_id: str) -> Path | None:
     """Find session transcript file by scanning project directories."""
-    claude_dir = get_claude_dir()
-    projects_dir = claude_dir / "projects"
+    cached = _transcript_paths.get(session_id)
+    if cached:
+        if os.path.isfile(cached):
+            return cached
+        # Moved or deleted; forget it and search again
+        del _transcript_paths[session_id]
+
+    # The persistent session index knows every transcript as of its last refresh
+    project_id = lookup_session_project(session_id)
+    if project_id:
+        session_file = _PROJECTS_DIR / project_id / f"{session_id}.jsonl"
+        if session_file.is_file():
+            _transcript_paths[session_id] = session_file
+            return session_file
+
+    projects_dir = _PROJECTS_DIR
 
     if not projects_dir.exists():
         return None
 
-    for project_dir in projects_dir.iterdir():
-        if not project_dir.is_dir():
-            continue
+    with os.scandir(projects_dir) as it:
+        for entry in it:
+            if not entry.is_dir():
+                continue
 
-        # Check for exact session file
-        session_file = project_dir / f"{session_id}.jsonl"
-        if session_file.exists():
-            return session_file
+            # Check for exact session file
+            session_file = os.path.join(entry.path, f"{session_id}.jsonl")
+            if os.path.isfile(session_file):
+                _transcript_paths[session_id] = Path(session_file)
+                return _transcript_paths[session_id]
 
     return None
 
 
-async def find_session_todos(session_id: str) -> list[dict]:
-    """Find todos for a session."""
-    claude_dir = get_claude_dir()
-    todos_dir = claude_dir / "todos"
-    todos = []
+async def find_session_transcript(session_id: str) -> Path | None:
+    """Find session transcript file by scanning project directories."""
+    return await asyncio.to_thread(_find_session_transcript, session_id)
 
-    if not todos_dir.exists():
-        return todos
 
-    for entry in todos_dir.iterdir():
-        if not entry.name.startswith(session_id):
-            continue
+def _find_todo_files(session_id: str) -> list[Path]:
+    """List a session's todo files, including those in per-session subdirectories."""
+    todos_dir = _TODOS_DIR
+    paths = []
 
-        if entry.is_file() and entry.suffix == ".json":
-            try:
-                data = json.loads(entry.read_text())
-                if isinstance(data.get("todos"), list):
-                    todos.extend(data["todos"])
-                elif data.get("content") and data.get("status"):
-                    todos.append(data)
-            except Exception:
-                continue
+    if not todos_dir.exists():
+        return paths
+
+    for entry in _find_session_entries(todos_dir, session_id):
+        if entry.is_file() and entry.name.endswith(".json"):
+            paths.append(Path(entry.path))
         elif entry.is_dir():
-            for sub_file in entry.iterdir():
-                if sub_file.suffix == ".json":
-                    try:
-                        data = json.loads(sub_file.read_text())
-                        if isinstance(data.get("todos"), list):
-                            todos.extend(data["todos"])
-                        elif data.get("content") and data.get("status"):
-                            todos.append(data)
-                    except Exception:
-                        continue
+            with os.scandir(entry.path) as it:
+                paths.extend(Path(f.path) for f in it if f.name.endswith(".json"))
+
+    return paths
+
 
+def _read_todo_file(path: Path) -> list[dict]:
+    """Read todo items from a todo file (a todos list or a single item)."""
+    data = orjson.loads(path.read_bytes())
+    if isinstance(data.get("todos"), list):
+        return data["todos"]
+    if data.get("content") and data.get("status"):
+        return [data]
+    return []
+
+
+@ttl_cache(LOOKUP_TTL_SECONDS)
+async def find_session_todos(session_id: str) -> list[dict]:
+    """Find todos for a session.
+
+    Candidate files are listed first, then read concurrently.
+    """
+    paths = await asyncio.to_thread(_find_todo_files, session_id)
+    results = await asyncio.gather(
+        *(_read_in_pool(_read_todo_file, path) for path in paths),
+        return_exceptions=True,
+    )
+
+    todos = []
+    for result in results:
+        if not isinstance(result, BaseException):
+            todos.extend(result)
     return todos
 
 
-async def find_session_file_history(session_id: str) -> list[dict]:
+def _find_session_file_history(session_id: str) -> list[dict]:
     """Find file history for a session."""
-    claude_dir = get_claude_dir()
     entries = []
     seen_backups = set()
+    seen_backup_names: set[str] = set()
 
     # First, try to find file-history-snapshot messages from session transcript
     try:
-        session_transcript = await find_session_transcript(session_id)
+        session_transcript = _find_session_transcript(session_id)
         if session_transcript:
-            content = session_transcript.read_text()
-            lines = parse_jsonl_file(content)
-
-            for parsed in lines:
+            # Snapshots are a small fraction of lines; skip the rest unparsed.
+            # Matching the quoted JSON string also skips messages that merely
+            # mention it, where the quotes are escaped.
+            for parsed in iter_jsonl_file(session_transcript, contains=b'"file-history-snapshot"'):
                 if parsed.get("type") != "file-history-snapshot":
                     continue
                 snapshot = parsed.get("snapshot", {})
@@ -108,6 +222,8 @@ async def find_session_file_history(session_id: str) -> list[dict]:
 
                     if key not in seen_backups:
                         seen_backups.add(key)
+                        if backup_file_name is not None:
+                            seen_backup_names.add(backup_file_name)
                         entries.append({
                             "filePath": file_path,
                             "backupFileName": backup_file_name,  # None for newly created files
@@ -119,22 +235,21 @@ async def find_session_file_history(session_id: str) -> list[dict]:
         pass
 
     # Also list any backup files directly in file-history/{sessionId}/
-    file_history_dir = claude_dir / "file-history" / session_id
+    file_history_dir = _FILE_HISTORY_DIR / session_id
     if file_history_dir.exists():
-        import re
-
-        for file in file_history_dir.iterdir():
+        # Only names are needed, so skip building Path objects
+        for name in os.listdir(file_history_dir):
             # Backup files have format: {hash}@v{version}
-            match = re.match(r"^(.+)@v(\d+)$", file.name)
-            if match:
-                backup_file_name = file.name
-                version = int(match.group(2))
+            file_hash, sep, version_str = name.rpartition("@v")
+            if sep and file_hash and version_str.isdecimal():
+                backup_file_name = name
+                version = int(version_str)
 
                 # Check if we already have this backup from transcript parsing
-                existing = [e for e in entries if e["backupFileName"] == backup_file_name]
-                if not existing:
+                if backup_file_name not in seen_backup_names:
+                    seen_backup_names.add(backup_file_name)
                     entries.append({
-                        "filePath": f"(unknown - {match.group(1)})",
+                        "filePath": f"(unknown - {file_hash})",
                         "backupFileName": backup_file_name,
                         "version": version,
                     })
@@ -144,47 +259,122 @@ async def find_session_file_history(session_id: str) -> list[dict]:
     return entries
 
 
-async def find_session_debug_logs(session_id: str) -> list[str]:
-    """Find debug logs for a session."""
-    claude_dir = get_claude_dir()
-    debug_dir = claude_dir / "debug"
-    logs = []
+@ttl_cache(LOOKUP_TTL_SECONDS)
+async def find_session_file_history(session_id: str) -> list[dict]:
+    """Find file history for a session."""
+    return await asyncio.to_thread(_find_session_file_history, session_id)
+
+
+# Most debug logs returned for one session
+DEBUG_LOG_LIMIT = 5
+
+
+def _find_debug_log_files(session_id: str) -> list[Path]:
+    """List debug log files whose name references a session."""
+    debug_dir = _DEBUG_DIR
 
     if not debug_dir.exists():
-        return logs
+        return []
+
+    # Names may contain the session ID anywhere, so filter the cached listing
+    entries, _ = _list_dir(debug_dir)
+    return [
+        Path(entry.path) for entry in entries
+        if (session_id in entry.name or entry.name.startswith(session_id[:8])) and entry.is_file()
+    ]
+
+
+def _read_debug_log(path: Path) -> str:
+    """Read a debug log, truncated to 5KB."""
+    with open(path) as f:
+        return f.read(5000)
+
+
+@ttl_cache(LOOKUP_TTL_SECONDS)
+async def find_session_debug_logs(session_id: str) -> list[str]:
+    """Find debug logs for a session.
+
+    Returns the first 5 matching logs that can be read. Logs are read
+    concurrently, a batch at a time, with each batch sized to the slots
+    that are still open.
+    """
+    paths = await asyncio.to_thread(_find_debug_log_files, session_id)
+    logs: list[str] = []
+
+    while paths and len(logs) < DEBUG_LOG_LIMIT:
+        batch, paths = paths[:DEBUG_LOG_LIMIT - len(logs)], paths[DEBUG_LOG_LIMIT - len(logs):]
+        results = await asyncio.gather(
+            *(_read_in_pool(_read_debug_log, path) for path in batch),
+            return_exceptions=True,
+        )
+        logs.extend(result for result in results if not isinstance(result, BaseException))
+
+    return logs
+
+
+def _read_plan_session_ids(path: str) -> frozenset[str]:
+    """Find the session IDs mentioned in a plan, scanning its raw bytes."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < PLAN_MMAP_MIN_BYTES:
+            matches = SESSION_ID_RE.findall(f.read())
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                matches = SESSION_ID_RE.findall(mm)
+    return frozenset(match.decode() for match in matches)
+
+
+def _refresh_plan_index(plans_dir: Path) -> None:
+    """Re-read new or modified plans and rebuild the session -> plan index.
+
+    Callers must hold _plan_index_lock.
+    """
+    changed = False
+    seen = set()
 
-    for file in debug_dir.iterdir():
-        if session_id in file.name or file.name.startswith(session_id[:8]):
+    with os.scandir(plans_dir) as it:
+        for entry in it:
+            if not entry.name.endswith(".md"):
+                continue
             try:
-                content = file.read_text()
-                logs.append(content[:5000])
+                mtime_ns = entry.stat().st_mtime_ns
+                seen.add(entry.name)
+
+                cached = _plan_session_ids.get(entry.name)
+                if cached and cached[0] == mtime_ns:
+                    continue
+
+                _plan_session_ids[entry.name] = (mtime_ns, _read_plan_session_ids(entry.path))
+                changed = True
             except Exception:
                 continue
 
-        if len(logs) >= 5:
-            break
+    for name in _plan_session_ids.keys() - seen:
+        del _plan_session_ids[name]
+        changed = True
 
-    return logs
+    if changed:
+        _plan_index.clear()
+        for name in sorted(_plan_session_ids):
+            for session_id in _plan_session_ids[name][1]:
+                _plan_index.setdefault(session_id, name)
 
 
-async def find_linked_plan(session_id: str) -> str | None:
+def _find_linked_plan(session_id: str) -> str | None:
     """Find a plan linked to a session."""
-    claude_dir = get_claude_dir()
-    plans_dir = claude_dir / "plans"
+    plans_dir = _PLANS_DIR
 
     if not plans_dir.exists():
         return None
 
-    for file in plans_dir.iterdir():
-        if file.suffix == ".md":
-            try:
-                content = file.read_text()
-                if session_id in content:
-                    return file.name
-            except Exception:
-                continue
+    with _plan_index_lock:
+        _refresh_plan_index(plans_dir)
+        return _plan_index.get(session_id)
 
-    return None
+
+@ttl_cache(LOOKUP_TTL_SECONDS)
+async def find_linked_plan(session_id: str) -> str | None:
+    """Find a plan linked to a session."""
+    return await asyncio.to_thread(_find_linked_plan, session_id)
 
 
 async def find_linked_skill(session_id: str) -> str | None:
@@ -193,13 +383,106 @@ async def find_linked_skill(session_id: str) -> str | None:
     return None
 
 
+def _find_session_project_dir(session_id: str) -> Path | None:
+    """Find the project directory containing a session's transcript."""
+    session_transcript = _find_session_transcript(session_id)
+    return session_transcript.parent if session_transcript else None
+
+
+def _list_agent_files(project_dir: Path) -> list[Path]:
+    """List sub-agent transcripts in a project directory."""
+    entries, _ = _list_dir(project_dir)
+    return [
+        Path(entry.path) for entry in entries
+        if entry.name.startswith("agent-")
+        and entry.name.endswith(".jsonl")
+        and entry.is_file(follow_symlinks=False)
+    ]
+
+
+def _parse_agent(agent_file: Path, session_id: str, decoded_path: str) -> dict | None:
+    """Parse a sub-agent transcript if it belongs to the given session.
+
+    Results are memoized by file mtime and size, so unchanged transcripts
+    are not re-read on later requests.
+    """
+    try:
+        st = agent_file.stat()
+    except OSError:
+        return None
+    return _parse_agent_cached(agent_file, st.st_mtime_ns, st.st_size, session_id, decoded_path)
+
+
+@lru_cache(maxsize=1024)
+def _parse_agent_cached(
+    agent_file: Path, mtime_ns: int, size: int, session_id: str, decoded_path: str
+) -> dict | None:
+    """Parse a sub-agent transcript; mtime_ns and size are part of the cache key only."""
+    from datetime import datetime
+
+    agent_id = agent_file.stem  # e.g., "agent-a6e31e7"
+
+    try:
+        with open(agent_file, "rb") as f:
+            first_line = f.readline()
+
+            # Most agent files belong to other sessions: reject them on the
+            # raw first line before parsing anything
+            if session_id.encode() not in first_line:
+                return None
+
+            # Check if this agent belongs to this session via sessionId field
+            # before reading the rest of the transcript
+            first_msg = orjson.loads(first_line)
+            if first_msg.get("sessionId") != session_id:
+                return None  # This agent belongs to a different session
+
+            # Parse agent session details
+            message_count = 0
+            start_time = None
+            end_time = None
+            model = None
+
+            for line in itertools.chain((first_line,), f):
+                try:
+                    parsed = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
+                msg_type = parsed.get("type")
+                if msg_type in ("user", "assistant"):
+                    message_count += 1
+                    timestamp = parsed.get("timestamp")
+                    if not start_time and timestamp:
+                        start_time = timestamp
+                    end_time = timestamp
+                    if msg_type == "assistant":
+                        msg = parsed.get("message", {})
+                        if isinstance(msg, dict) and msg.get("model"):
+                            model = msg["model"]
+
+        return {
+            "id": agent_id,
+            "projectPath": decoded_path,
+            "startTime": start_time or datetime.now().isoformat(),
+            "endTime": end_time,
+            "messageCount": message_count,
+            "model": model,
+            "isSubAgent": True,
+            "parentSessionId": session_id,
+            "subAgentIds": None,
+        }
+    except Exception:
+        return None
+
+
 async def find_sub_agent_sessions(
     session_id: str, project_dir: Path | None = None
 ) -> dict:
     """Find sub-agent sessions for a given session.
 
     Uses the sessionId field in sub-agent messages to establish parent-child
-    relationships, not just filename pattern matching.
+    relationships, not just filename pattern matching. Agent transcripts are
+    parsed concurrently in worker threads.
 
     Args:
         session_id: The parent session UUID to find sub-agents for
@@ -208,26 +491,14 @@ async def find_sub_agent_sessions(
     Returns:
         Dict with parentSessionId (if this is a sub-agent) and subAgents list
     """
-    from datetime import datetime
-
-    claude_dir = get_claude_dir()
-    projects_dir = claude_dir / "projects"
     is_agent_session = session_id.startswith("agent-")
 
     parent_session_id = None
     sub_agents = []
 
-    if not projects_dir.exists():
-        return {"parentSessionId": parent_session_id, "subAgents": sub_agents}
-
     # Find the project directory if not provided
     if project_dir is None:
-        for dir_entry in projects_dir.iterdir():
-            if not dir_entry.is_dir():
-                continue
-            if (dir_entry / f"{session_id}.jsonl").exists():
-                project_dir = dir_entry
-                break
+        project_dir = await asyncio.to_thread(_find_session_project_dir, session_id)
 
     if project_dir is None:
         return {"parentSessionId": parent_session_id, "subAgents": sub_agents}
@@ -236,59 +507,16 @@ async def find_sub_agent_sessions(
 
     if is_agent_session:
         # For agent sessions, use shared helper to get parent sessionId
-        parent_session_id = get_parent_session_id(project_dir, session_id)
+        parent_session_id = await asyncio.to_thread(
+            get_parent_session_id, project_dir, session_id
+        )
     else:
         # For main sessions, find all agent files that reference this session
-        agent_files = [f for f in project_dir.iterdir()
-                      if f.suffix == ".jsonl" and f.name.startswith("agent-")]
-
-        for agent_file in agent_files:
-            agent_id = agent_file.stem  # e.g., "agent-a6e31e7"
-            agent_path = agent_file
-
-            try:
-                content = agent_path.read_text()
-                lines = parse_jsonl_file(content)
-                if not lines:
-                    continue
-
-                # Check if this agent belongs to this session via sessionId field
-                first_msg = lines[0]
-                agent_parent_session_id = first_msg.get("sessionId")
-
-                if agent_parent_session_id != session_id:
-                    continue  # This agent belongs to a different session
-
-                # Parse agent session details
-                message_count = 0
-                start_time = None
-                end_time = None
-                model = None
-
-                for parsed in lines:
-                    if parsed.get("type") in ("user", "assistant"):
-                        message_count += 1
-                        if not start_time and parsed.get("timestamp"):
-                            start_time = parsed["timestamp"]
-                        end_time = parsed.get("timestamp")
-                        if parsed.get("type") == "assistant":
-                            msg = parsed.get("message", {})
-                            if isinstance(msg, dict) and msg.get("model"):
-                                model = msg["model"]
-
-                sub_agents.append({
-                    "id": agent_id,
-                    "projectPath": decoded_path,
-                    "startTime": start_time or datetime.now().isoformat(),
-                    "endTime": end_time,
-                    "messageCount": message_count,
-                    "model": model,
-                    "isSubAgent": True,
-                    "parentSessionId": session_id,
-                    "subAgentIds": None,
-                })
-            except Exception:
-                continue
+        agent_files = await asyncio.to_thread(_list_agent_files, project_dir)
+        results = await asyncio.gather(
+            *(_read_in_pool(_parse_agent, f, session_id, decoded_path) for f in agent_files)
+        )
+        sub_agents = [r for r in results if r is not None]
 
     return {"parentSessionId": parent_session_id, "subAgents": sub_agents}
 
@@ -332,21 +560,17 @@ async def get_files_changed(
     """
     file_history = await find_session_file_history(session_id)
 
-    # Group entries by file path
-    files_by_path: dict[str, list[dict]] = {}
+    # Group entries by file path; file history is sorted by (path, version),
+    # so each group is already in version order
+    files_by_path: dict[str, list[dict]] = defaultdict(list)
     for entry in file_history:
-        path = entry["filePath"]
-        if path not in files_by_path:
-            files_by_path[path] = []
-        files_by_path[path].append(entry)
+        files_by_path[entry["filePath"]].append(entry)
 
     files = []
     created_count = 0
     modified_count = 0
 
-    for path, entries in files_by_path.items():
-        # Sort by version to find v1
-        sorted_entries = sorted(entries, key=lambda e: e.get("version", 0))
+    for path, sorted_entries in files_by_path.items():
         v1 = sorted_entries[0] if sorted_entries else None
 
         # Created if v1 has no backupFileName (file didn't exist before)
@@ -375,7 +599,7 @@ async def get_files_changed(
         })
 
     # Sort files by path for consistent output
-    files.sort(key=lambda f: f["path"])
+    files.sort(key=itemgetter("path"))
 
     return {
         "sessionId": session_id,
@@ -388,44 +612,79 @@ async def get_files_changed(
     }
 
 
-@router.get("/{session_id}/file-history/{backup_file_name}")
+# Backups larger than this are streamed as raw bytes instead of wrapped in JSON
+INLINE_BACKUP_MAX_BYTES = 64 * 1024
+
+
+def _read_backup(backup_path: Path) -> tuple[str, int]:
+    """Read a backup file's content and size in bytes with a single read."""
+    data = backup_path.read_bytes()
+    return data.decode("utf-8", errors="replace"), len(data)
+
+
+@router.get(
+    "/{session_id}/file-history/{backup_file_name}",
+    response_model=FileBackupContent,
+)
 async def get_file_backup(
     session_id: str = PathParam(
         description="Session UUID the backup belongs to"
     ),
     backup_file_name: str = PathParam(
         description="Backup filename in format {hash}@v{version} (e.g., '59e0b9c43163e850@v1')"
-    )
-) -> FileBackupContent:
+    ),
+    raw: bool = Query(
+        False,
+        description="Return the raw file bytes instead of a JSON envelope, regardless of size"
+    ),
+) -> FileBackupContent | FileResponse:
     """Get content of a specific file backup.
 
     Retrieves the raw file content from the session's file history.
+    Backups over 64KB, or any backup when raw=true, are streamed as
+    application/octet-stream rather than embedded in JSON. The name is sent
+    percent-encoded in an X-Backup-Name header and the size in bytes in an
+    X-Backup-Size header, which survives gzip dropping Content-Length.
+    Content that is not valid UTF-8 is returned with replacement characters
+    in the JSON form.
 
     Args:
         session_id: Session UUID
         backup_file_name: Backup filename (URL-encoded if necessary)
+        raw: Stream the file bytes instead of returning JSON
 
     Returns:
-        FileBackupContent with backupFileName, content, and size in bytes
+        FileBackupContent with backupFileName, content, and size in bytes,
+        or the raw file for large backups
 
     Raises:
         400: Invalid backup file path (path traversal attempt)
         404: Backup file not found
     """
     backup_file_name = unquote(backup_file_name)
-    claude_dir = get_claude_dir()
-    backup_path = claude_dir / "file-history" / session_id / backup_file_name
+    file_history_dir = get_claude_dir_resolved() / "file-history"
+    backup_path = (file_history_dir / session_id / backup_file_name).resolve()
 
-    # Security check
-    if not str(backup_path).startswith(str(claude_dir / "file-history")):
+    # Security: resolve ".." and symlinks before checking containment
+    if not backup_path.is_relative_to(file_history_dir):
         raise HTTPException(status_code=400, detail="Invalid backup file path")
 
-    if not backup_path.exists():
+    try:
+        st = await asyncio.to_thread(backup_path.stat)
+        if (raw or st.st_size > INLINE_BACKUP_MAX_BYTES) and stat.S_ISREG(st.st_mode):
+            return FileResponse(
+                backup_path,
+                media_type="application/octet-stream",
+                headers={
+                    "X-Backup-Name": quote(backup_path.name),
+                    "X-Backup-Size": str(st.st_size),
+                },
+            )
+
+        content, size = await asyncio.to_thread(_read_backup, backup_path)
+    except (FileNotFoundError, IsADirectoryError):
         raise HTTPException(status_code=404, detail="Backup file not found")
 
-    content = backup_path.read_text()
-    size = backup_path.stat().st_size
-
     return {
         "backupFileName": backup_file_name,
         "content": content,
@@ -433,6 +692,27 @@ async def get_file_backup(
     }
 
 
+def _list_env_files(session_id: str) -> list[Path]:
+    """List a session's environment files."""
+    env_dir = _SESSION_ENV_DIR / session_id
+
+    if not env_dir.exists():
+        return []
+
+    with os.scandir(env_dir) as it:
+        return [Path(entry.path) for entry in it if entry.is_file()]
+
+
+def _read_env_file(path: Path) -> dict[str, str]:
+    """Parse KEY=value lines from an environment file."""
+    env = {}
+    for line in path.read_text().splitlines():
+        key, sep, value = line.partition("=")
+        if sep:
+            env[key] = value
+    return env
+
+
 @router.get("/{session_id}/environment")
 async def get_environment(
     session_id: str = PathParam(
@@ -447,21 +727,17 @@ async def get_environment(
     Returns:
         data: Dictionary of environment variable name to value
     """
-    claude_dir = get_claude_dir()
-    env_dir = claude_dir / "session-env" / session_id
-    env = {}
-
-    if env_dir.exists():
-        for file in env_dir.iterdir():
-            try:
-                content = file.read_text()
-                for line in content.split("\n"):
-                    if "=" in line:
-                        key, value = line.split("=", 1)
-                        env[key] = value
-            except Exception:
-                continue
+    paths = await asyncio.to_thread(_list_env_files, session_id)
+    results = await asyncio.gather(
+        *(_read_in_pool(_read_env_file, path) for path in paths),
+        return_exceptions=True,
+    )
 
+    # Later files override earlier ones, as when reading them in order
+    env = {}
+    for result in results:
+        if not isinstance(result, BaseException):
+            env.update(result)
     return {"data": env}
 
 
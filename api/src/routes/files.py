@@ -4,21 +4,78 @@ Provides generic file system browsing within the Claude data directory.
 Useful for exploring raw data files not covered by specific endpoints.
 """
 
+import asyncio
+import os
+import stat
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException, Query
 
 from ..models import Error, FileContent
-from ..utils import get_claude_dir
+from ..utils import get_claude_dir_resolved
 
 router = APIRouter(prefix="/files", tags=["files"])
 
+MAX_FILE_BYTES = 100 * 1024
+
+
+def _browse_path(path: str) -> dict:
+    """List a directory or read a file within the Claude data directory."""
+    claude_dir = get_claude_dir_resolved()
+
+    # Security: normalize and validate path is within ~/.claude/
+    requested_path = (claude_dir / path).resolve()
+
+    if not requested_path.is_relative_to(claude_dir):
+        raise HTTPException(status_code=400, detail="Path must be within Claude data directory")
+
+    # One stat answers existence, type and size
+    try:
+        st = requested_path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        raise HTTPException(status_code=404, detail="Path not found")
+    except PermissionError:
+        raise HTTPException(status_code=403, detail="Permission denied")
+    except OSError:
+        raise HTTPException(status_code=400, detail="Path cannot be accessed")
+
+    if stat.S_ISDIR(st.st_mode):
+        # List directory contents
+        # scandir reports entry types from the directory read, without a stat per entry
+        with os.scandir(requested_path) as it:
+            entries = [{"name": e.name, "isDirectory": e.is_dir()} for e in it]
+        return {
+            "type": "directory",
+            "path": str(requested_path),
+            "entries": entries,
+        }
+    elif stat.S_ISREG(st.st_mode):
+        # Return file content (limit to 100KB)
+        if st.st_size > MAX_FILE_BYTES:
+            return {
+                "type": "file",
+                "path": str(requested_path),
+                "error": "File too large (max 100KB)",
+            }
+
+        # Bound the read too, in case the file grew since the stat
+        with open(requested_path) as f:
+            content = f.read(MAX_FILE_BYTES)
+        return {
+            "type": "file",
+            "path": str(requested_path),
+            "content": content,
+        }
+    else:
+        raise HTTPException(status_code=400, detail="Path is not a file or directory")
+
 
 @router.get(
     "/",
     response_model=FileContent,
     responses={
         400: {"model": Error, "description": "Invalid path or path traversal attempt"},
+        403: {"model": Error, "description": "Path not readable"},
         404: {"model": Error, "description": "Path not found"},
     },
 )
@@ -53,45 +110,8 @@ async def browse_files(
         content (for files) or entries (for directories)
 
     Raises:
-        400: Path traversal attempt or invalid path type
+        400: Path traversal attempt, invalid path type, or unusable path
+        403: Path not readable
         404: Path not found
     """
-    claude_dir = get_claude_dir()
-
-    # Security: normalize and validate path is within ~/.claude/
-    requested_path = (claude_dir / path).resolve()
-
-    if not str(requested_path).startswith(str(claude_dir.resolve())):
-        raise HTTPException(status_code=400, detail="Path must be within Claude data directory")
-
-    if not requested_path.exists():
-        raise HTTPException(status_code=404, detail="Path not found")
-
-    if requested_path.is_dir():
-        # List directory contents
-        entries = [
-            {"name": e.name, "isDirectory": e.is_dir()}
-            for e in requested_path.iterdir()
-        ]
-        return {
-            "type": "directory",
-            "path": str(requested_path),
-            "entries": entries,
-        }
-    elif requested_path.is_file():
-        # Return file content (limit to 100KB)
-        if requested_path.stat().st_size > 100 * 1024:
-            return {
-                "type": "file",
-                "path": str(requested_path),
-                "error": "File too large (max 100KB)",
-            }
-
-        content = requested_path.read_text()
-        return {
-            "type": "file",
-            "path": str(requested_path),
-            "content": content,
-        }
-    else:
-        raise HTTPException(status_code=400, detail="Path is not a file or directory")
+    return await asyncio.to_thread(_browse_path, path)
@@ -4,13 +4,78 @@ Provides access to prompt history - a chronological log of all user
 prompts across projects without full conversation context.
 """
 
+import bisect
+import heapq
+from datetime import datetime
+from pathlib import Path
+
+import orjson
 from fastapi import APIRouter, Query
 
 from ..models import HistoryResponse
-from ..utils import build_path_lookup, encode_project_path, get_claude_config, get_claude_dir, parse_jsonl_file
+from ..utils import encode_project_path, get_claude_dir, get_path_lookup, iter_jsonl_file
 
 router = APIRouter(prefix="/history", tags=["history"])
 
+# Timestamp index over history.jsonl: (file identity, bytes indexed, sorted
+# timestamps, matching line offsets). The file is append-only, so new lines
+# are indexed incrementally from the last indexed byte.
+_history_index: tuple[tuple[int, int], int, list[int], list[int]] | None = None
+
+
+def _refresh_history_index(history_path: Path) -> tuple[list[int], list[int]]:
+    """Bring the timestamp index up to date and return (timestamps, offsets)."""
+    global _history_index
+    stat = history_path.stat()
+    identity = (stat.st_dev, stat.st_ino)
+
+    # Start over if the file was replaced or truncated
+    if _history_index is None or _history_index[0] != identity or stat.st_size < _history_index[1]:
+        indexed, timestamps, offsets = 0, [], []
+    else:
+        _, indexed, timestamps, offsets = _history_index
+
+    if stat.st_size > indexed:
+        with open(history_path, "rb") as f:
+            f.seek(indexed)
+            tail = f.read(stat.st_size - indexed)
+
+        # Only index complete lines; a partial last line is picked up next time
+        end = tail.rfind(b"\n") + 1
+        pos = 0
+        while pos < end:
+            nl = tail.find(b"\n", pos)
+            line = tail[pos:nl].strip()
+            if line:
+                try:
+                    entry = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    entry = None
+                if isinstance(entry, dict):
+                    ts = entry.get("timestamp", 0)
+                    if not isinstance(ts, (int, float)):
+                        ts = 0
+                    i = bisect.bisect_right(timestamps, ts)
+                    timestamps.insert(i, ts)
+                    offsets.insert(i, indexed + pos)
+            pos = nl + 1
+        indexed += end
+
+    _history_index = (identity, indexed, timestamps, offsets)
+    return timestamps, offsets
+
+
+def _iter_history_range(history_path: Path, start_ts: float | None, end_ts: float | None):
+    """Yield history entries with timestamps in [start_ts, end_ts], in file order."""
+    timestamps, offsets = _refresh_history_index(history_path)
+    lo = bisect.bisect_left(timestamps, start_ts) if start_ts is not None else 0
+    hi = bisect.bisect_right(timestamps, end_ts) if end_ts is not None else len(timestamps)
+
+    with open(history_path, "rb") as f:
+        for offset in sorted(offsets[lo:hi]):
+            f.seek(offset)
+            yield orjson.loads(f.readline())
+
 
 @router.get("/", response_model=HistoryResponse)
 async def get_history(
@@ -66,39 +131,48 @@ async def get_history(
         }
 
     try:
-        content = history_path.read_text()
-        entries = parse_jsonl_file(content)
-
-        # Apply filters
+        # Resolve filters once, before reading any entries
+        project_path = None
         if project_id:
-            config = await get_claude_config()
-            path_lookup = build_path_lookup(config)
-            real_path = path_lookup.get(project_id)
-            if real_path:
-                entries = [e for e in entries if e.get("project") == real_path]
-            else:
-                entries = []
-
-        if search:
-            query = search.lower()
-            entries = [e for e in entries if query in e.get("display", "").lower()]
-
-        if start_date:
-            from datetime import datetime
-            start_ts = datetime.fromisoformat(start_date).timestamp() * 1000
-            entries = [e for e in entries if e.get("timestamp", 0) >= start_ts]
-
-        if end_date:
-            from datetime import datetime
-            end_ts = datetime.fromisoformat(end_date).timestamp() * 1000
-            entries = [e for e in entries if e.get("timestamp", 0) <= end_ts]
-
-        # Sort by timestamp descending
-        entries.sort(key=lambda e: e.get("timestamp", 0), reverse=True)
-
-        # Paginate
+            path_lookup = await get_path_lookup()
+            project_path = path_lookup.get(project_id)
+            if not project_path:
+                return {
+                    "data": [],
+                    "meta": {"total": 0, "limit": limit, "offset": offset, "hasMore": False},
+                }
+
+        query = search.lower() if search else None
+        start_ts = datetime.fromisoformat(start_date).timestamp() * 1000 if start_date else None
+        end_ts = datetime.fromisoformat(end_date).timestamp() * 1000 if end_date else None
+
+        # A project filter only needs lines containing the JSON-encoded path
+        contains = orjson.dumps(project_path) if project_path else None
+
+        # Filter while streaming instead of materializing every entry
+        entries = []
+        # Date filters are answered from the timestamp index
+        if start_ts is not None or end_ts is not None:
+            candidates = _iter_history_range(history_path, start_ts, end_ts)
+        else:
+            candidates = iter_jsonl_file(history_path, contains=contains)
+
+        for e in candidates:
+            if project_path and e.get("project") != project_path:
+                continue
+            if query and query not in e.get("display", "").lower():
+                continue
+            if start_ts is not None and e.get("timestamp", 0) < start_ts:
+                continue
+            if end_ts is not None and e.get("timestamp", 0) > end_ts:
+                continue
+            entries.append(e)
+
+        # Only the requested page needs ordering: select the newest
+        # offset + limit entries rather than sorting them all
         total = len(entries)
-        paginated = entries[offset : offset + limit]
+        newest = heapq.nlargest(offset + limit, entries, key=lambda e: e.get("timestamp", 0))
+        paginated = newest[offset:]
 
         # Transform entries to use projectPath and projectId
         transformed = []
@@ -4,6 +4,8 @@ Plans are markdown documents created during plan mode with
 auto-generated whimsical names.
 """
 
+import asyncio
+import os
 from urllib.parse import unquote
 
 from fastapi import APIRouter, HTTPException, Path
@@ -14,6 +16,18 @@ from ..utils import get_claude_dir
 router = APIRouter(prefix="/plans", tags=["plans"])
 
 
+def _list_plan_names() -> list[str]:
+    """List plan markdown filenames."""
+    claude_dir = get_claude_dir()
+    plans_dir = claude_dir / "plans"
+
+    if not plans_dir.exists():
+        return []
+
+    with os.scandir(plans_dir) as it:
+        return [entry.name for entry in it if entry.name.endswith(".md")]
+
+
 @router.get("/")
 async def list_plans() -> dict[str, list[str]]:
     """List all plan documents.
@@ -24,13 +38,7 @@ async def list_plans() -> dict[str, list[str]]:
     Returns:
         data: List of plan filenames
     """
-    claude_dir = get_claude_dir()
-    plans_dir = claude_dir / "plans"
-
-    if not plans_dir.exists():
-        return {"data": []}
-
-    plans = [f.name for f in plans_dir.iterdir() if f.suffix == ".md"]
+    plans = await asyncio.to_thread(_list_plan_names)
     return {"data": plans}
 
 
@@ -66,5 +74,5 @@ async def get_plan(
     if not plan_path.exists():
         raise HTTPException(status_code=404, detail="Plan not found")
 
-    content = plan_path.read_text()
+    content = await asyncio.to_thread(plan_path.read_text)
     return {"name": plan_name, "content": content}
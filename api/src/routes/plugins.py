@@ -4,9 +4,11 @@ Plugins are installed extensions from marketplaces. The plugin registry
 tracks installation metadata including version, scope, and provided skills.
 """
 
-import json
+import asyncio
+import os
 from urllib.parse import unquote
 
+import orjson
 from fastapi import APIRouter, HTTPException, Path
 
 from ..models import Plugin
@@ -15,42 +17,70 @@ from ..utils import get_claude_dir
 router = APIRouter(prefix="/plugins", tags=["plugins"])
 
 
-async def get_installed_plugins() -> list[dict]:
-    """Get list of installed plugins from installed_plugins.json."""
-    claude_dir = get_claude_dir()
-    plugins_file = claude_dir / "plugins" / "installed_plugins.json"
+# Parsed plugin registry, cached as (mtime_ns, plugins) and re-read when
+# installed_plugins.json changes. Skills are listed per request, since they
+# can change without the registry changing.
+_plugins_cache: tuple[int, list[dict]] | None = None
 
-    if not plugins_file.exists():
+
+def _list_plugin_skills(install_path: str | None) -> list[str]:
+    """Get skills provided by a plugin."""
+    if not install_path:
         return []
 
-    try:
-        data = json.loads(plugins_file.read_text())
-        return data if isinstance(data, list) else []
-    except Exception:
+    skills_dir = os.path.join(install_path, "skills")
+    if not os.path.isdir(skills_dir):
         return []
 
+    with os.scandir(skills_dir) as it:
+        return [entry.name for entry in it if entry.is_dir()]
 
-async def get_plugin_skills(plugin_name: str, install_path: str | None) -> list[str]:
-    """Get skills provided by a plugin."""
-    skills = []
 
-    if not install_path:
-        return skills
+def _load_plugins(plugins_file) -> list[dict]:
+    """Parse the plugin registry, without skills."""
+    data = orjson.loads(plugins_file.read_bytes())
+    if not isinstance(data, list):
+        return []
 
-    from pathlib import Path
+    return [
+        {
+            "name": p.get("name", ""),
+            "version": p.get("version", ""),
+            "scope": p.get("scope"),
+            "installPath": p.get("installPath"),
+            "installedAt": p.get("installedAt"),
+            "gitCommitSha": p.get("gitCommitSha"),
+        }
+        for p in data
+    ]
 
-    plugin_path = Path(install_path)
-    skills_dir = plugin_path / "skills"
 
-    if skills_dir.exists():
-        for entry in skills_dir.iterdir():
-            if entry.is_dir():
-                skills.append(entry.name)
+def _with_skills(plugins: list[dict]) -> list[dict]:
+    """Add each plugin's current skills to copies of the registry entries."""
+    return [{**p, "skills": _list_plugin_skills(p["installPath"])} for p in plugins]
 
-    return skills
 
+async def get_installed_plugins() -> list[dict]:
+    """Get installed plugins and their skills from installed_plugins.json."""
+    global _plugins_cache
 
-@router.get("/")
+    claude_dir = get_claude_dir()
+    plugins_file = claude_dir / "plugins" / "installed_plugins.json"
+
+    try:
+        mtime_ns = plugins_file.stat().st_mtime_ns
+        if _plugins_cache and _plugins_cache[0] == mtime_ns:
+            plugins = _plugins_cache[1]
+        else:
+            plugins = await asyncio.to_thread(_load_plugins, plugins_file)
+            _plugins_cache = (mtime_ns, plugins)
+
+        return await asyncio.to_thread(_with_skills, plugins)
+    except Exception:
+        return []
+
+
+@router.get("/", response_model_exclude_none=True)
 async def list_plugins() -> dict[str, list[Plugin]]:
     """List all installed plugins.
 
@@ -65,26 +95,10 @@ async def list_plugins() -> dict[str, list[Plugin]]:
               installedAt, gitCommitSha, and skills
     """
     plugins = await get_installed_plugins()
-
-    result = []
-    for p in plugins:
-        plugin = {
-            "name": p.get("name", ""),
-            "version": p.get("version", ""),
-            "scope": p.get("scope"),
-            "installPath": p.get("installPath"),
-            "installedAt": p.get("installedAt"),
-            "gitCommitSha": p.get("gitCommitSha"),
-        }
-
-        # Find skills for this plugin
-        plugin["skills"] = await get_plugin_skills(plugin["name"], plugin.get("installPath"))
-        result.append(plugin)
-
-    return {"data": result}
+    return {"data": plugins}
 
 
-@router.get("/{name}", response_model=Plugin)
+@router.get("/{name}", response_model=Plugin, response_model_exclude_none=True)
 async def get_plugin(
     name: str = Path(
         description="Plugin identifier in format 'plugin-name@marketplace' (e.g., 'artifact-workflow@alteredcraft-plugins')"
@@ -107,17 +121,8 @@ async def get_plugin(
     name = unquote(name)
     plugins = await get_installed_plugins()
 
-    for p in plugins:
-        if p.get("name") == name:
-            plugin = {
-                "name": p.get("name", ""),
-                "version": p.get("version", ""),
-                "scope": p.get("scope"),
-                "installPath": p.get("installPath"),
-                "installedAt": p.get("installedAt"),
-                "gitCommitSha": p.get("gitCommitSha"),
-            }
-            plugin["skills"] = await get_plugin_skills(name, p.get("installPath"))
+    for plugin in plugins:
+        if plugin["name"] == name:
             return plugin
 
     raise HTTPException(status_code=404, detail="Plugin not found")
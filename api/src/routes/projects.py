@@ -5,14 +5,26 @@ accessing project activity timelines. Projects are identified by their
 filesystem path with sessions stored as JSONL transcripts.
 """
 
-import json
+import asyncio
+import heapq
+import multiprocessing
+import os
+import re
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 from urllib.parse import unquote
 
+import orjson
 from fastapi import APIRouter, HTTPException, Query
 from fastapi import Path as PathParam
+from fastapi.responses import ORJSONResponse
 
 from ..models import (
     ActivityResponse,
@@ -33,120 +45,504 @@ from ..models import (
     TodoItem,
 )
 from ..utils import (
-    build_path_lookup,
     decode_project_path,
     encode_project_path,
     extract_cwd_from_project_dir,
-    get_claude_config,
+    get_claude_config_and_lookup,
     get_claude_dir,
     get_display_path,
     get_parent_session_id,
+    get_path_lookup,
     get_project_name,
+    iter_jsonl_file,
     normalize_path_prefix,
-    parse_jsonl_file,
     parse_timestamp,
 )
+from ..session_index import lookup_message_counts, lookup_session_bounds
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
 
-async def get_session_files(encoded_project_path: str) -> list[dict]:
-    """Get session files for a project, sorted by modification time."""
-    claude_dir = get_claude_dir()
-    project_dir = claude_dir / "projects" / encoded_project_path
+# Cached .jsonl names per project directory: (directory mtime_ns, names).
+# A directory's mtime changes when entries are added, removed or renamed.
+_session_names_cache: dict[str, tuple[int, list[str]]] = {}
 
-    if not project_dir.exists():
+
+def _list_session_names(project_dir: str) -> list[str]:
+    """List transcript filenames in a project directory, reusing an unchanged listing."""
+    mtime_ns = os.stat(project_dir).st_mtime_ns
+    cached = _session_names_cache.get(project_dir)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+
+    with os.scandir(project_dir) as it:
+        names = [entry.name for entry in it if entry.name.endswith(".jsonl")]
+    _session_names_cache[project_dir] = (mtime_ns, names)
+    return names
+
+
+def _project_session_stats(project_dir: str) -> tuple[int, float | None]:
+    """Count a project's transcripts and find the newest mtime in one pass.
+
+    Lighter than get_session_files for listings: no per-file records or
+    datetimes, just a running count and maximum.
+    """
+    try:
+        names = _list_session_names(project_dir)
+    except (FileNotFoundError, NotADirectoryError):
+        return 0, None
+
+    count = 0
+    newest_ns, newest = -1, None
+    for name in names:
+        try:
+            stat = os.stat(os.path.join(project_dir, name))
+        except FileNotFoundError:
+            continue
+        count += 1
+        if stat.st_mtime_ns > newest_ns:
+            newest_ns, newest = stat.st_mtime_ns, stat.st_mtime
+    return count, newest
+
+
+async def get_session_files(encoded_project_path: str, ordered: bool = True) -> list[dict]:
+    """Get session files for a project, newest first.
+
+    Pass ordered=False to skip the sort when the caller only needs a few of
+    the newest files or a single extreme.
+    """
+    # Plain string paths: this runs per project and stats every transcript
+    project_dir = os.path.join(get_claude_dir(), "projects", encoded_project_path)
+
+    try:
+        names = _list_session_names(project_dir)
+    except (FileNotFoundError, NotADirectoryError):
         return []
 
+    # Files are still stat'ed each call: appending to a transcript changes
+    # its mtime and size but not the directory's mtime
     files = []
-    for f in project_dir.iterdir():
-        if f.suffix == ".jsonl":
-            stat = f.stat()
-            files.append({"name": f.name, "mtime": datetime.fromtimestamp(stat.st_mtime)})
+    for name in names:
+        try:
+            stat = os.stat(os.path.join(project_dir, name))
+        except FileNotFoundError:
+            continue
+        files.append({
+            "name": name,
+            "mtime": datetime.fromtimestamp(stat.st_mtime),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+        })
 
-    files.sort(key=lambda x: x["mtime"], reverse=True)
+    if ordered:
+        files.sort(key=itemgetter("mtime_ns"), reverse=True)
     return files
 
 
-async def get_session_bounds(
-    encoded_project_path: str, filename: str
-) -> dict:
-    """Get session time bounds and message count."""
-    claude_dir = get_claude_dir()
-    file_path = claude_dir / "projects" / encoded_project_path / filename
+# Bytes of a transcript's start remembered to detect a rewritten file
+BOUNDS_PREFIX_BYTES = 64
+
+# Snapshot records start with these bytes, as Claude Code writes them
+_SNAPSHOT_LINE_PREFIXES = (b'{"type":"file-history-snapshot"', b'{"type": "file-history-snapshot"')
+
+# Bounds parsed so far per transcript path: (bytes consumed, file prefix, bounds).
+# Transcripts are append-only, so when one grows only the new lines are parsed.
+_bounds_progress: dict[str, tuple[int, bytes, dict]] = {}
 
+
+def _add_bounds_line(bounds: dict, line: bytes) -> None:
+    """Fold one transcript line into running session bounds."""
+    # Snapshots aren't counted, so skip decoding their often large payloads
+    if line.startswith(_SNAPSHOT_LINE_PREFIXES):
+        return
+    # orjson accepts the surrounding whitespace; blank lines fail to parse
     try:
-        content = file_path.read_text()
-        lines = parse_jsonl_file(content)
+        parsed = orjson.loads(line)
+    except orjson.JSONDecodeError:
+        return
+
+    if parsed.get("type") == "file-history-snapshot":
+        return
+    bounds["message_count"] += 1
+
+    timestamp = parse_timestamp(parsed.get("timestamp"))
+    if timestamp:
+        if bounds["start_time"] is None:  # First valid timestamp = start
+            bounds["start_time"] = timestamp
+        bounds["end_time"] = timestamp  # Last valid timestamp = end
+    if parsed.get("type") == "assistant":
+        msg = parsed.get("message", {})
+        if msg.get("model"):
+            bounds["model"] = msg["model"]
 
-        start_time = None  # Don't default to now - remain undetermined if no timestamps
-        end_time = None
-        message_count = 0
-        model = None
+    # Session metadata only considers typed, timestamped messages
+    if not timestamp or not parsed.get("type"):
+        return
+    msg = parsed.get("message")
+    if isinstance(msg, dict):
+        if msg.get("model"):
+            bounds["message_model"] = msg["model"]
+        blocks = msg.get("content")
+        if parsed.get("type") == "assistant" and isinstance(blocks, list):
+            add_tool = bounds["tools_used"].add
+            for block in blocks:
+                if isinstance(block, dict) and block.get("type") == "tool_use":
+                    name = block.get("name")
+                    if name:
+                        add_tool(name)
 
-        for i, parsed in enumerate(lines):
-            if parsed.get("type") == "file-history-snapshot":
-                continue
-            message_count += 1
-
-            timestamp = parse_timestamp(parsed.get("timestamp"))
-            if timestamp:
-                if start_time is None:  # First valid timestamp = start
-                    start_time = timestamp
-                end_time = timestamp  # Last valid timestamp = end
-            if parsed.get("type") == "assistant":
-                msg = parsed.get("message", {})
-                if msg.get("model"):
-                    model = msg["model"]
-
-        return {
-            "start_time": start_time,
-            "end_time": end_time,
-            "message_count": message_count,
-            "model": model,
-        }
+
+def _copy_bounds(bounds: dict) -> dict:
+    """Copy running bounds so folding more lines leaves the original intact."""
+    return {**bounds, "tools_used": set(bounds["tools_used"])}
+
+
+def _scan_bounds(
+    file_path: str, size: int, progress: tuple[int, bytes, dict] | None
+) -> tuple[tuple[int, bytes, dict], bytes | None]:
+    """Fold a transcript's complete lines into bounds, resuming from progress.
+
+    Returns the new progress and any trailing partial line. Kept free of
+    shared state so large transcripts can be scanned in a worker process.
+    """
+    with open(file_path, "rb") as f:
+        prefix = f.read(BOUNDS_PREFIX_BYTES)
+
+        # Resume after the lines already parsed unless the file shrank or was rewritten
+        if progress and progress[0] <= size and prefix.startswith(progress[1]):
+            offset, bounds = progress[0], _copy_bounds(progress[2])
+        else:
+            # Don't default to now - remain undetermined if no timestamps
+            offset, bounds = 0, {
+                "start_time": None,
+                "end_time": None,
+                "message_count": 0,
+                "model": None,
+                "message_model": None,  # Model of the last timestamped message, for metadata
+                "tools_used": set(),
+            }
+
+        f.seek(offset)
+        partial = None
+        for line in f:
+            if not line.endswith(b"\n"):
+                # Still being written; counted now but re-read next time
+                partial = line
+                break
+            offset += len(line)
+            _add_bounds_line(bounds, line)
+
+    return (offset, prefix, bounds), partial
+
+
+# Unparsed spans at least this large are decoded in a worker process, so a
+# giant transcript doesn't hold the GIL that other requests' threads need
+BOUNDS_PROCESS_MIN_BYTES = 64 * 1024 * 1024
+
+_bounds_pool: ProcessPoolExecutor | None = None
+
+
+def _get_bounds_pool() -> ProcessPoolExecutor:
+    """Create (once) the process pool for scanning large transcripts."""
+    global _bounds_pool
+    if _bounds_pool is None:
+        # spawn, not fork: the server process already runs worker threads
+        _bounds_pool = ProcessPoolExecutor(
+            max_workers=min(4, os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _bounds_pool
+
+
+@lru_cache(maxsize=4096)
+def _session_bounds_cached(file_path: str, mtime_ns: int, size: int) -> dict:
+    """Compute session bounds; mtime_ns and size are part of the cache key only."""
+    # A fresh process starts from the persisted index before parsing anything
+    if file_path not in _bounds_progress:
+        project_dir, filename = os.path.split(file_path)
+        indexed = lookup_session_bounds(os.path.basename(project_dir), filename[:-6], mtime_ns, size)
+        if indexed is not None:
+            return indexed
+
+    progress = _bounds_progress.get(file_path)
+    if size - (progress[0] if progress else 0) >= BOUNDS_PROCESS_MIN_BYTES:
+        # Runs in a worker thread already, so blocking on the result is fine
+        progress, partial = _get_bounds_pool().submit(_scan_bounds, file_path, size, progress).result()
+    else:
+        progress, partial = _scan_bounds(file_path, size, progress)
+
+    _bounds_progress[file_path] = progress
+    bounds = progress[2]
+    if partial:
+        bounds = _copy_bounds(bounds)
+        _add_bounds_line(bounds, partial)
+    return bounds
+
+
+# Snapshot records as they appear after the preceding line's newline
+_SNAPSHOT_RECORD_PATTERNS = tuple(b"\n" + prefix for prefix in _SNAPSHOT_LINE_PREFIXES)
+
+# Read size for counting transcript lines
+COUNT_CHUNK_BYTES = 1024 * 1024
+
+
+@lru_cache(maxsize=4096)
+def _count_session_messages(file_path: str, mtime_ns: int, size: int) -> int:
+    """Count a transcript's messages without parsing it.
+
+    Counts lines minus file-history-snapshot records using bytes.count on
+    raw chunks. Matches the parsed count for well-formed transcripts; blank
+    or malformed lines are counted here but skipped by get_session_bounds.
+    mtime_ns and size are part of the cache key only.
+    """
+    lines = 0
+    snapshots = 0
+    last_byte = b"\n"
+    # Each pattern keeps its own carry so records split across reads are
+    # found once; a leading newline makes the file start a line start
+    carries = [b"\n"] * len(_SNAPSHOT_RECORD_PATTERNS)
+
+    with open(file_path, "rb") as f:
+        while chunk := f.read(COUNT_CHUNK_BYTES):
+            lines += chunk.count(b"\n")
+            for i, pattern in enumerate(_SNAPSHOT_RECORD_PATTERNS):
+                window = carries[i] + chunk
+                snapshots += window.count(pattern)
+                carries[i] = window[-(len(pattern) - 1):]
+            last_byte = chunk[-1:]
+
+    if last_byte != b"\n":
+        lines += 1  # Final line without a trailing newline
+    return lines - snapshots
+
+
+# Caps concurrent transcript reads when listings gather over many sessions,
+# so a large project can't queue hundreds of open files at once
+SESSION_IO_CONCURRENCY = 16
+_session_io_slots = asyncio.Semaphore(SESSION_IO_CONCURRENCY)
+
+
+async def get_session_message_count(
+    encoded_project_path: str, filename: str, mtime_ns: int, size: int
+) -> int:
+    """Get a session's message count when its time bounds aren't needed."""
+    file_path = os.path.join(get_claude_dir(), "projects", encoded_project_path, filename)
+    try:
+        async with _session_io_slots:
+            return await asyncio.to_thread(_count_session_messages, file_path, mtime_ns, size)
+    except OSError:
+        return 0
+
+
+# How long a missing transcript is remembered before the filesystem is checked again
+MISSING_SESSION_TTL_SECONDS = 5.0
+
+# Transcript paths recently found missing, with the monotonic time they were checked
+_missing_sessions: dict[str, float] = {}
+
+
+def _read_session_bounds(
+    encoded_project_path: str,
+    filename: str,
+    mtime_ns: int | None,
+    size: int | None,
+) -> dict:
+    """Get session time bounds and message count (blocking)."""
+    key = os.path.join(get_claude_dir(), "projects", encoded_project_path, filename)
+
+    now = time.monotonic()
+
+    try:
+        # A caller-supplied stat is fresh, so the missing-file memo only
+        # applies when this call has to stat the transcript itself
+        if mtime_ns is None or size is None:
+            checked = _missing_sessions.get(key)
+            if checked is not None and now - checked < MISSING_SESSION_TTL_SECONDS:
+                return {"start_time": None, "end_time": None, "message_count": 0}
+            stat = os.stat(key)
+            mtime_ns, size = stat.st_mtime_ns, stat.st_size
+        return _session_bounds_cached(key, mtime_ns, size)
+    except FileNotFoundError:
+        if len(_missing_sessions) >= 1024:
+            _missing_sessions.clear()
+        _missing_sessions[key] = now
+        return {"start_time": None, "end_time": None, "message_count": 0}
     except Exception:
         return {"start_time": None, "end_time": None, "message_count": 0}
 
 
-async def get_session_messages_raw(
-    encoded_project_path: str, session_id: str
-) -> list[dict]:
-    """Get raw messages for a session."""
+async def get_session_bounds(
+    encoded_project_path: str,
+    filename: str,
+    mtime_ns: int | None = None,
+    size: int | None = None,
+) -> dict:
+    """Get session time bounds and message count.
+
+    Results are cached per file version, so repeated listings only parse
+    transcripts that changed. Pass mtime_ns and size from get_session_files
+    to skip the stat. The returned dict is shared and must not be modified.
+    The read runs in a worker thread, so listings can gather many at once;
+    at most SESSION_IO_CONCURRENCY reads are in flight.
+    """
+    async with _session_io_slots:
+        return await asyncio.to_thread(_read_session_bounds, encoded_project_path, filename, mtime_ns, size)
+
+
+def _session_file_path(encoded_project_path: str, session_id: str) -> Path:
+    """Get the transcript path for a session ID or filename."""
     claude_dir = get_claude_dir()
     filename = session_id if session_id.endswith(".jsonl") else f"{session_id}.jsonl"
-    file_path = claude_dir / "projects" / encoded_project_path / filename
+    return claude_dir / "projects" / encoded_project_path / filename
 
-    try:
-        content = file_path.read_text()
-        lines = parse_jsonl_file(content)
-        messages = []
 
-        for parsed in lines:
-            if not parsed.get("type") or parsed.get("type") == "file-history-snapshot":
-                continue
+# UTC timestamps as Claude Code writes them. Days past the 28th are left to
+# the full parser, so every match is a real date.
+_UTC_TIMESTAMP_PATTERN = re.compile(
+    r"([1-9]\d{3}-(?:0[1-9]|1[0-2])-(?:0[1-9]|1\d|2[0-8])T(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d)"
+    r"(?:\.(\d{1,6}))?(?:Z|\+00:00)"
+)
+
+
+def _format_timestamp(value: Any) -> str | None:
+    """Normalize a transcript timestamp to the ISO form datetime.isoformat() gives.
+
+    Common UTC strings are rewritten textually instead of being parsed into a
+    datetime and formatted back; anything else takes the full parse.
+    """
+    if isinstance(value, str):
+        match = _UTC_TIMESTAMP_PATTERN.fullmatch(value)
+        if match:
+            seconds, fraction = match.groups()
+            if fraction and fraction.strip("0"):
+                return f"{seconds}.{fraction.ljust(6, '0')}+00:00"
+            return f"{seconds}+00:00"
+
+    timestamp = parse_timestamp(value)
+    return timestamp.isoformat() if timestamp else None
+
+
+def _build_message(parsed: dict, session_id: str) -> dict | None:
+    """Convert a transcript entry to a message, or None if it isn't one."""
+    if not parsed.get("type") or parsed.get("type") == "file-history-snapshot":
+        return None
+
+    timestamp = _format_timestamp(parsed.get("timestamp"))
+    if not timestamp:
+        return None
+
+    return {
+        "uuid": parsed.get("uuid") or parsed.get("messageId", ""),
+        "parent_uuid": parsed.get("parentUuid"),
+        "type": parsed["type"],
+        "timestamp": timestamp,
+        "session_id": parsed.get("sessionId") or session_id,
+        "content": parsed.get("message", {"role": parsed["type"], "content": ""}),
+        "model": parsed.get("message", {}).get("model") if isinstance(parsed.get("message"), dict) else None,
+        "cwd": parsed.get("cwd"),
+        "git_branch": parsed.get("gitBranch"),
+    }
+
+
+def _may_be_message(line: bytes) -> bool:
+    """Cheap byte check for lines _build_message could accept, before decoding."""
+    return b'"timestamp"' in line and not line.startswith(_SNAPSHOT_LINE_PREFIXES)
+
+
+# Parsed message entries per transcript version, least recently used first,
+# bounded by the summed size of the cached transcripts. Transcripts larger
+# than the whole budget are parsed on every request instead of cached.
+SESSION_ENTRIES_CACHE_BYTES = 64 * 1024 * 1024
+_session_entries_cache: OrderedDict[tuple[str, int, int], list[dict]] = OrderedDict()
+_session_entries_cache_bytes = 0
+_session_entries_lock = threading.Lock()
+
+
+def _session_entries(file_path: str, mtime_ns: int, size: int) -> list[dict]:
+    """Get the transcript entries that are messages, cached per transcript version.
 
-            timestamp = parse_timestamp(parsed.get("timestamp"))
-            if not timestamp:
+    mtime_ns and size are part of the cache key, and size counts toward the
+    cache's byte budget. The returned list is shared between callers and must
+    not be modified.
+    """
+    global _session_entries_cache_bytes
+    key = (file_path, mtime_ns, size)
+
+    with _session_entries_lock:
+        entries = _session_entries_cache.get(key)
+        if entries is not None:
+            _session_entries_cache.move_to_end(key)
+            return entries
+
+    entries = _parse_session_entries(file_path)
+    if size > SESSION_ENTRIES_CACHE_BYTES:
+        return entries
+
+    with _session_entries_lock:
+        if key not in _session_entries_cache:
+            _session_entries_cache[key] = entries
+            _session_entries_cache_bytes += size
+            while _session_entries_cache_bytes > SESSION_ENTRIES_CACHE_BYTES:
+                (_, _, evicted_size), _ = _session_entries_cache.popitem(last=False)
+                _session_entries_cache_bytes -= evicted_size
+    return entries
+
+
+def _parse_session_entries(file_path: str) -> list[dict]:
+    """Parse the transcript entries that are messages (blocking).
+
+    Only entries _build_message accepts are kept, so callers can filter and
+    paginate them and build message dicts for just the rows they return.
+    """
+    entries = []
+    with open(file_path, "rb") as f:
+        for line in f:
+            if not _may_be_message(line):
                 continue
+            try:
+                parsed = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+            if isinstance(parsed, dict) and _build_message(parsed, "") is not None:
+                entries.append(parsed)
+    return entries
 
-            messages.append({
-                "uuid": parsed.get("uuid") or parsed.get("messageId", ""),
-                "parent_uuid": parsed.get("parentUuid"),
-                "type": parsed["type"],
-                "timestamp": timestamp.isoformat(),
-                "session_id": parsed.get("sessionId") or session_id,
-                "content": parsed.get("message", {"role": parsed["type"], "content": ""}),
-                "model": parsed.get("message", {}).get("model") if isinstance(parsed.get("message"), dict) else None,
-                "cwd": parsed.get("cwd"),
-                "git_branch": parsed.get("gitBranch"),
-            })
 
-        return messages
+def _read_session_entries(encoded_project_path: str, session_id: str) -> list[dict]:
+    """Get a session's message entries (blocking)."""
+    file_path = _session_file_path(encoded_project_path, session_id)
+
+    try:
+        stat = file_path.stat()
+        return _session_entries(str(file_path), stat.st_mtime_ns, stat.st_size)
     except Exception:
         return []
 
 
+def _find_session_message(
+    encoded_project_path: str, session_id: str, message_id: str
+) -> dict | None:
+    """Find one message by UUID, decoding only lines that mention it.
+
+    The transcript is searched for the JSON-encoded ID, so the first entry
+    keyed by it is found without parsing the rest of the file.
+    """
+    file_path = _session_file_path(encoded_project_path, session_id)
+
+    try:
+        for parsed in iter_jsonl_file(file_path, contains=orjson.dumps(message_id)):
+            if not isinstance(parsed, dict):
+                continue
+            if (parsed.get("uuid") or parsed.get("messageId", "")) != message_id:
+                continue
+            message = _build_message(parsed, session_id)
+            if message is not None:
+                return message
+        return None
+    except Exception:
+        return None
+
+
 @router.get("/", response_model=PaginatedResponse[Project])
 async def list_projects(
     sort_by: str = Query(
@@ -196,14 +592,17 @@ async def list_projects(
     if not projects_dir.exists():
         return {"data": [], "meta": {"total": 0, "limit": limit, "offset": offset, "hasMore": False}}
 
-    config = await get_claude_config()
-    path_lookup = build_path_lookup(config)
+    config, path_lookup = await get_claude_config_and_lookup()
     config_projects = config.get("projects", {})
 
+    # scandir reports entry types from the directory read, without a stat per entry
+    with os.scandir(projects_dir) as it:
+        all_entries = list(it)
+    project_entries = [entry for entry in all_entries if entry.is_dir()]
+    entry_names = {entry.name for entry in all_entries}
+
     projects = []
-    for entry in projects_dir.iterdir():
-        if not entry.is_dir():
-            continue
+    for entry in project_entries:
 
         # Try config lookup first, then agent file cwd, then fallback decode
         if entry.name in path_lookup:
@@ -211,26 +610,22 @@ async def list_projects(
             is_orphan = False
         else:
             # Orphan directory - try to get real path from agent files
-            decoded_path = extract_cwd_from_project_dir(entry) or decode_project_path(entry.name)
+            decoded_path = extract_cwd_from_project_dir(Path(entry.path)) or decode_project_path(entry.name)
             is_orphan = True
 
         project_config = config_projects.get(decoded_path, {})
-        session_files = await get_session_files(entry.name)
-
-        last_activity = None
-        if session_files:
-            last_activity = session_files[0]["mtime"].isoformat()
 
+        # sessionCount and lastActivity are filled in below, only where needed
         projects.append({
             "path": decoded_path,
             "projectId": entry.name,
             "displayPath": get_display_path(decoded_path),
             "name": get_project_name(decoded_path),
-            "sessionCount": len(session_files),
+            "sessionCount": 0,
             "hasSessionData": True,
             "isOrphan": is_orphan,
             "lastSessionId": project_config.get("lastSessionId"),
-            "lastActivity": last_activity,
+            "lastActivity": None,
             "lastCost": project_config.get("lastCost"),
             "lastDuration": project_config.get("lastDuration"),
             "lastTotalInputTokens": project_config.get("lastTotalInputTokens"),
@@ -244,7 +639,7 @@ async def list_projects(
             continue  # Already added from directory
 
         encoded = encode_project_path(real_path)
-        if (projects_dir / encoded).exists():
+        if encoded in entry_names:
             continue  # Has directory, already processed
 
         # Config-only project - no session data
@@ -272,6 +667,28 @@ async def list_projects(
             if any(p["path"].startswith(prefix) for prefix in normalized_prefixes)
         ]
 
+    async def fill_session_data(project: dict) -> None:
+        if not project["hasSessionData"]:
+            return
+        project_dir = os.path.join(projects_dir, project["projectId"])
+        async with _session_io_slots:
+            count, newest = await asyncio.to_thread(_project_session_stats, project_dir)
+        project["sessionCount"] = count
+        if newest is not None:
+            project["lastActivity"] = datetime.fromtimestamp(newest).isoformat()
+
+    # Listing a project's sessions stats every transcript, so only do it for
+    # every project when sorting by last activity; otherwise just the page
+    if sort_by == "lastActivity":
+        await asyncio.gather(*(fill_session_data(p) for p in projects))
+    elif sort_by == "sessionCount":
+        for p in projects:
+            if p["hasSessionData"]:
+                try:
+                    p["sessionCount"] = len(_list_session_names(os.path.join(projects_dir, p["projectId"])))
+                except OSError:
+                    pass
+
     # Sort
     def sort_key(p):
         if sort_by == "lastActivity":
@@ -282,11 +699,12 @@ async def list_projects(
             return p.get("sessionCount", 0)
         return ""
 
-    projects.sort(key=sort_key, reverse=(sort_order == "desc"))
-
-    # Paginate
+    # Only the rows up to the end of the page need ordering
     total = len(projects)
-    paginated = projects[offset : offset + limit]
+    select = heapq.nlargest if sort_order == "desc" else heapq.nsmallest
+    paginated = select(offset + limit, projects, key=sort_key)[offset:]
+    if sort_by != "lastActivity":
+        await asyncio.gather(*(fill_session_data(p) for p in paginated))
 
     return {
         "data": paginated,
@@ -326,28 +744,55 @@ async def get_project(
     if not project_dir.exists():
         raise HTTPException(status_code=404, detail=f"Project not found: {project_id_unquoted}")
 
-    config = await get_claude_config()
-    path_lookup = build_path_lookup(config)
+    config, path_lookup = await get_claude_config_and_lookup()
     decoded_path = path_lookup.get(project_id_unquoted) or decode_project_path(project_id_unquoted)
     config_projects = config.get("projects", {})
     project_config = config_projects.get(decoded_path, {})
-    session_files = await get_session_files(project_id_unquoted)
+    session_files = await get_session_files(project_id_unquoted, ordered=False)
+
+    # Only the ten newest sessions need ordering; the rest just get counted
+    recent_files = heapq.nlargest(10, session_files, key=itemgetter("mtime_ns"))
+    recent_names = {file["name"] for file in recent_files}
+    older_files = [file for file in session_files if file["name"] not in recent_names]
+
+    # Unchanged older transcripts take their counts from the persistent index
+    indexed_counts = lookup_message_counts(project_id_unquoted)
+    total_messages = 0
+    uncounted_files = []
+    for file in older_files:
+        indexed = indexed_counts.get(file["name"][:-6])
+        if indexed and indexed[:2] == (file["mtime_ns"], file["size"]):
+            total_messages += indexed[2]
+        else:
+            uncounted_files.append(file)
 
     last_activity = None
+    first_session = None
     if session_files:
-        last_activity = session_files[0]["mtime"].isoformat()
-
-    # Get project directory for relationship lookups
-    claude_dir = get_claude_dir()
-    project_dir = claude_dir / "projects" / project_id_unquoted
+        last_activity = recent_files[0]["mtime"].isoformat()
+        first_session = min(session_files, key=itemgetter("mtime_ns"))["mtime"].isoformat()
 
-    # Get recent sessions with details
+    # Get recent sessions with details, totalling the activity summary in the same pass
     recent_sessions = []
     agent_sessions = []
-    for file in session_files[:10]:
+    # Older sessions only contribute to the totals, so they are counted, not parsed
+    recent_bounds, older_counts = await asyncio.gather(
+        asyncio.gather(*(
+            get_session_bounds(project_id_unquoted, file["name"], file["mtime_ns"], file["size"])
+            for file in recent_files
+        )),
+        asyncio.gather(*(
+            get_session_message_count(project_id_unquoted, file["name"], file["mtime_ns"], file["size"])
+            for file in uncounted_files
+        )),
+    )
+    total_messages += sum(older_counts)
+    total_agent_sessions = sum(1 for file in session_files if file["name"].startswith("agent-"))
+
+    for file, bounds in zip(recent_files, recent_bounds):
         session_id = file["name"].replace(".jsonl", "")
-        bounds = await get_session_bounds(project_id_unquoted, file["name"])
         is_sub_agent = session_id.startswith("agent-")
+        total_messages += bounds["message_count"]
 
         session = {
             "id": session_id,
@@ -379,18 +824,6 @@ async def get_project(
             agent_ids = parent_to_agents.get(session["id"], [])
             session["subAgentIds"] = agent_ids if agent_ids else None
 
-    # Calculate activity summary
-    total_messages = 0
-    total_agent_sessions = 0
-    for file in session_files:
-        session_id = file["name"].replace(".jsonl", "")
-        if session_id.startswith("agent-"):
-            total_agent_sessions += 1
-        bounds = await get_session_bounds(project_id_unquoted, file["name"])
-        total_messages += bounds["message_count"]
-
-    first_session = session_files[-1]["mtime"].isoformat() if session_files else None
-
     return {
         "path": decoded_path,
         "projectId": project_id_unquoted,
@@ -433,8 +866,7 @@ async def get_project_config(
         404: Project not found in config (orphan project)
     """
     project_id_unquoted = unquote(project_id)
-    config = await get_claude_config()
-    path_lookup = build_path_lookup(config)
+    config, path_lookup = await get_claude_config_and_lookup()
 
     decoded_path = path_lookup.get(project_id_unquoted)
     if not decoded_path:
@@ -502,8 +934,7 @@ async def list_sessions(
         meta: Pagination metadata
     """
     project_id_unquoted = unquote(project_id)
-    config = await get_claude_config()
-    path_lookup = build_path_lookup(config)
+    path_lookup = await get_path_lookup()
     decoded_path = path_lookup.get(project_id_unquoted) or decode_project_path(project_id_unquoted)
     session_files = await get_session_files(project_id_unquoted)
 
@@ -511,72 +942,86 @@ async def list_sessions(
     claude_dir = get_claude_dir()
     project_dir = claude_dir / "projects" / project_id_unquoted
 
-    sessions = []
-    agent_sessions = []
-    for file in session_files:
-        session_id = file["name"].replace(".jsonl", "")
-        bounds = await get_session_bounds(project_id_unquoted, file["name"])
-        is_sub_agent = session_id.startswith("agent-")
-
-        session = {
-            "id": session_id,
-            "projectPath": decoded_path,
-            "startTime": bounds["start_time"].isoformat() if bounds["start_time"] else None,
-            "endTime": bounds["end_time"].isoformat() if bounds["end_time"] else None,
-            "messageCount": bounds["message_count"],
-            "model": bounds.get("model"),
-            "isSubAgent": is_sub_agent,
-            "parentSessionId": None,
-            "subAgentIds": None,
-        }
-        sessions.append(session)
-        if is_sub_agent:
-            agent_sessions.append(session)
-
-    # Populate parent-child relationships
-    from collections import defaultdict
-    parent_to_agents: dict[str, list[str]] = defaultdict(list)
-
-    for agent in agent_sessions:
-        parent_id = get_parent_session_id(project_dir, agent["id"])
-        agent["parentSessionId"] = parent_id
-        if parent_id:
-            parent_to_agents[parent_id].append(agent["id"])
-
-    # Populate subAgentIds on parent sessions
-    for session in sessions:
-        if not session["isSubAgent"]:
-            agent_ids = parent_to_agents.get(session["id"], [])
-            session["subAgentIds"] = agent_ids if agent_ids else None
-
-    # Filter by type
+    # Filter by type on file names alone, before reading any transcript
     if type == "regular":
-        sessions = [s for s in sessions if not s["isSubAgent"]]
+        candidates = [f for f in session_files if not f["name"].startswith("agent-")]
     elif type == "agent":
-        sessions = [s for s in sessions if s["isSubAgent"]]
+        candidates = [f for f in session_files if f["name"].startswith("agent-")]
+    else:
+        candidates = session_files
 
-    # Filter by date range
+    start_dt = end_dt = None
     if start_date:
         start_dt = datetime.strptime(start_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-        sessions = [
-            s for s in sessions
-            if s["startTime"] and datetime.fromisoformat(s["startTime"]) >= start_dt
-        ]
+        # A transcript is last modified at or after its start, so files
+        # untouched since start_date can't have started within the range
+        cutoff_ns = int(start_dt.timestamp()) * 1_000_000_000
+        candidates = [f for f in candidates if f["mtime_ns"] >= cutoff_ns]
     if end_date:
         # End of day for end_date (inclusive)
         end_dt = datetime.strptime(end_date, "%Y-%m-%d").replace(
             hour=23, minute=59, second=59, tzinfo=timezone.utc
         )
-        sessions = [
-            s for s in sessions
-            if s["startTime"] and datetime.fromisoformat(s["startTime"]) <= end_dt
+
+    if start_dt or end_dt:
+        # Date filters need each candidate's actual start time
+        all_bounds = await asyncio.gather(*(
+            get_session_bounds(project_id_unquoted, file["name"], file["mtime_ns"], file["size"])
+            for file in candidates
+        ))
+        matches = [
+            (file, bounds)
+            for file, bounds in zip(candidates, all_bounds)
+            if bounds["start_time"]
+            and (not start_dt or bounds["start_time"] >= start_dt)
+            and (not end_dt or bounds["start_time"] <= end_dt)
         ]
+        total = len(matches)
+        page = matches[offset : offset + limit]
+    else:
+        # Without date filters only the requested page needs parsing
+        total = len(candidates)
+        page_files = candidates[offset : offset + limit]
+        page_bounds = await asyncio.gather(*(
+            get_session_bounds(project_id_unquoted, file["name"], file["mtime_ns"], file["size"])
+            for file in page_files
+        ))
+        page = list(zip(page_files, page_bounds))
+
+    # Parent links come from each agent transcript's first line; regular
+    # sessions on the page need every agent's link to list their sub-agents
+    page_ids = [file["name"].replace(".jsonl", "") for file, _ in page]
+    if all(session_id.startswith("agent-") for session_id in page_ids):
+        agent_ids = page_ids
+    else:
+        agent_ids = [
+            f["name"].replace(".jsonl", "") for f in session_files if f["name"].startswith("agent-")
+        ]
+    parent_ids = {agent_id: get_parent_session_id(project_dir, agent_id) for agent_id in agent_ids}
 
-    # Paginate
-    total = len(sessions)
-    paginated = sessions[offset : offset + limit]
+    parent_to_agents: dict[str, list[str]] = defaultdict(list)
+    for agent_id, parent_id in parent_ids.items():
+        if parent_id:
+            parent_to_agents[parent_id].append(agent_id)
 
-    return {
+    paginated = []
+    for session_id, (file, bounds) in zip(page_ids, page):
+        is_sub_agent = session_id.startswith("agent-")
+        sub_agent_ids = None if is_sub_agent else parent_to_agents.get(session_id)
+        paginated.append({
+            "id": session_id,
+            "projectPath": decoded_path,
+            "startTime": bounds["start_time"].isoformat() if bounds["start_time"] else None,
+            "endTime": bounds["end_time"].isoformat() if bounds["end_time"] else None,
+            "messageCount": bounds["message_count"],
+            "model": bounds.get("model"),
+            "isSubAgent": is_sub_agent,
+            "parentSessionId": parent_ids[session_id] if is_sub_agent else None,
+            "subAgentIds": sub_agent_ids or None,
+        })
+
+    # Rows are built field-for-field in the response schema, so skip revalidating them
+    return ORJSONResponse({
         "data": paginated,
         "meta": {
             "total": total,
@@ -584,7 +1029,7 @@ async def list_sessions(
             "offset": offset,
             "hasMore": offset + limit < total,
         },
-    }
+    })
 
 
 @sessions_router.get("/{session_id}", response_model=SessionDetail)
@@ -615,8 +1060,7 @@ async def get_session(
         404: Session not found
     """
     project_id_unquoted = unquote(project_id)
-    config = await get_claude_config()
-    path_lookup = build_path_lookup(config)
+    path_lookup = await get_path_lookup()
     decoded_path = path_lookup.get(project_id_unquoted) or decode_project_path(project_id_unquoted)
 
     claude_dir = get_claude_dir()
@@ -626,8 +1070,9 @@ async def get_session(
     if not file_path.exists():
         raise HTTPException(status_code=404, detail=f"Session not found: {session_id}")
 
+    # Bounds and metadata come from the same pass over the transcript
     bounds = await get_session_bounds(project_id_unquoted, filename)
-    metadata = await get_session_metadata(project_id_unquoted, session_id)
+    metadata = _session_metadata(bounds)
     correlated = await get_correlated_data(session_id)
 
     duration = None
@@ -673,32 +1118,12 @@ async def get_session(
     }
 
 
-async def get_session_metadata(
-    encoded_project_path: str, session_id: str
-) -> dict:
-    """Get session metadata including tools used."""
-    messages = await get_session_messages_raw(encoded_project_path, session_id)
-    tools_used = set()
-    model = None
-
-    for msg in messages:
-        if msg.get("model"):
-            model = msg["model"]
-
-        if msg.get("type") == "assistant":
-            content = msg.get("content", {})
-            if isinstance(content, dict):
-                blocks = content.get("content", [])
-                if isinstance(blocks, list):
-                    for block in blocks:
-                        if isinstance(block, dict) and block.get("type") == "tool_use":
-                            if block.get("name"):
-                                tools_used.add(block["name"])
-
+def _session_metadata(bounds: dict) -> dict:
+    """Build session metadata from bounds computed in the same pass."""
     return {
         "totalTokens": 0,
-        "model": model,
-        "toolsUsed": list(tools_used),
+        "model": bounds.get("message_model"),
+        "toolsUsed": list(bounds.get("tools_used", ())),
     }
 
 
@@ -712,28 +1137,29 @@ async def get_correlated_data(session_id: str) -> dict:
         find_session_todos,
     )
 
-    todos = await find_session_todos(session_id)
-    file_history = await find_session_file_history(session_id)
-    debug_logs = await find_session_debug_logs(session_id)
-    linked_plan = await find_linked_plan(session_id)
-    linked_skill = await find_linked_skill(session_id)
+    # Lookups touch independent directories, so run them concurrently
+    todos, file_history, debug_logs, linked_plan, linked_skill = await asyncio.gather(
+        find_session_todos(session_id),
+        find_session_file_history(session_id),
+        find_session_debug_logs(session_id),
+        find_linked_plan(session_id),
+        find_linked_skill(session_id),
+    )
 
     # Build files_changed from file_history
     files_changed = None
     if file_history:
-        files_by_path: dict[str, list[dict]] = {}
+        # File history is sorted by (path, version), so each group is
+        # already in version order
+        files_by_path: dict[str, list[dict]] = defaultdict(list)
         for entry in file_history:
-            path = entry["filePath"]
-            if path not in files_by_path:
-                files_by_path[path] = []
-            files_by_path[path].append(entry)
+            files_by_path[entry["filePath"]].append(entry)
 
         files = []
         created_count = 0
         modified_count = 0
 
-        for path, entries in files_by_path.items():
-            sorted_entries = sorted(entries, key=lambda e: e.get("version", 0))
+        for path, sorted_entries in files_by_path.items():
             v1 = sorted_entries[0] if sorted_entries else None
             is_created = v1 is not None and v1.get("backupFileName") is None
             action = "created" if is_created else "modified"
@@ -758,7 +1184,7 @@ async def get_correlated_data(session_id: str) -> dict:
                 "backups": backups,
             })
 
-        files.sort(key=lambda f: f["path"])
+        files.sort(key=itemgetter("path"))
 
         files_changed = {
             "sessionId": session_id,
@@ -829,17 +1255,22 @@ async def list_messages(
         meta: Pagination metadata
     """
     project_id_unquoted = unquote(project_id)
-    messages = await get_session_messages_raw(project_id_unquoted, session_id)
+    entries = await asyncio.to_thread(_read_session_entries, project_id_unquoted, session_id)
 
     # Filter by type
     if type == "user":
-        messages = [m for m in messages if m["type"] == "user"]
+        entries = [e for e in entries if e["type"] == "user"]
     elif type == "assistant":
-        messages = [m for m in messages if m["type"] == "assistant"]
+        entries = [e for e in entries if e["type"] == "assistant"]
+
+    # Paginate, building message dicts only for the returned page
+    total = len(entries)
+    paginated = [_build_message(e, session_id) for e in entries[offset : offset + limit]]
 
-    # Flatten content if requested - keeps role but flattens inner content to string
+    # Flatten content if requested - keeps role but flattens inner content to string.
+    # Only the returned page is flattened.
     if flatten:
-        for msg in messages:
+        for msg in paginated:
             content = msg.get("content", {})
             if isinstance(content, dict):
                 role = content.get("role", msg.get("type", ""))
@@ -861,10 +1292,6 @@ async def list_messages(
                     if thinking_parts:
                         msg["thinking"] = "\n\n".join(thinking_parts)
 
-    # Paginate
-    total = len(messages)
-    paginated = messages[offset : offset + limit]
-
     return {
         "data": paginated,
         "meta": {
@@ -902,11 +1329,9 @@ async def get_message(
         404: Message not found
     """
     project_id_unquoted = unquote(project_id)
-    messages = await get_session_messages_raw(project_id_unquoted, session_id)
-
-    for msg in messages:
-        if msg["uuid"] == message_id:
-            return msg
+    msg = await asyncio.to_thread(_find_session_message, project_id_unquoted, session_id, message_id)
+    if msg is not None:
+        return msg
 
     raise HTTPException(status_code=404, detail=f"Message not found: {message_id}")
 
@@ -1045,8 +1470,7 @@ async def get_activity(
         summary: ActivitySummaryStats with totals and maxDailyMessages
     """
     project_id_unquoted = unquote(project_id)
-    config = await get_claude_config()
-    path_lookup = build_path_lookup(config)
+    path_lookup = await get_path_lookup()
     decoded_path = path_lookup.get(project_id_unquoted) or decode_project_path(project_id_unquoted)
     session_files = await get_session_files(project_id_unquoted)
 
@@ -1054,13 +1478,42 @@ async def get_activity(
     claude_dir = get_claude_dir()
     project_dir = claude_dir / "projects" / project_id_unquoted
 
-    sessions = []
+    from datetime import timedelta
+    now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(days=days)
+    cutoff_ns = int(cutoff.timestamp() * 1_000_000_000)
+
     agent_sessions = []
+    files_to_parse = []
     for file in session_files:
-        session_id = file["name"].replace(".jsonl", "")
-        bounds = await get_session_bounds(project_id_unquoted, file["name"])
+        # Files are newest first, and a session can't start after its file was
+        # last written, so every remaining session started before the cutoff
+        if file["mtime_ns"] < cutoff_ns:
+            break
+
+        session_id = file["name"][:-6]  # Strip ".jsonl"
         is_sub_agent = session_id.startswith("agent-")
 
+        # Skip parsing sessions the type filter would drop. Agents are still
+        # tracked for a regular-only timeline so parents get subAgentIds.
+        if type == "agent" and not is_sub_agent:
+            continue
+        if type == "regular" and is_sub_agent:
+            agent_sessions.append({"id": session_id})
+            continue
+        files_to_parse.append(file)
+
+    all_bounds = await asyncio.gather(*(
+        get_session_bounds(project_id_unquoted, file["name"], file["mtime_ns"], file["size"])
+        for file in files_to_parse
+    ))
+
+    # Group by day as sessions are built; only those that started within the
+    # window are kept, while every agent is still linked to its parent below
+    daily_map: dict[str, dict] = {}
+    for file, bounds in zip(files_to_parse, all_bounds):
+        session_id = file["name"][:-6]  # Strip ".jsonl"
+        is_sub_agent = session_id.startswith("agent-")
         session = {
             "id": session_id,
             "projectPath": decoded_path,
@@ -1072,10 +1525,19 @@ async def get_activity(
             "parentSessionId": None,
             "subAgentIds": None,
         }
-        sessions.append(session)
         if is_sub_agent:
             agent_sessions.append(session)
 
+        if not session["startTime"] or session["startTime"] < cutoff:
+            continue
+
+        date_str = session["startTime"].date().isoformat()
+        if date_str not in daily_map:
+            daily_map[date_str] = {"sessions": [], "total_messages": 0}
+
+        daily_map[date_str]["sessions"].append(session)
+        daily_map[date_str]["total_messages"] += session["messageCount"]
+
     # Populate parent-child relationships
     from collections import defaultdict
     parent_to_agents: dict[str, list[str]] = defaultdict(list)
@@ -1086,49 +1548,20 @@ async def get_activity(
         if parent_id:
             parent_to_agents[parent_id].append(agent["id"])
 
-    # Populate subAgentIds on parent sessions
-    for session in sessions:
-        if not session["isSubAgent"]:
-            agent_ids = parent_to_agents.get(session["id"], [])
-            session["subAgentIds"] = agent_ids if agent_ids else None
-
-    # Filter by type
-    if type == "regular":
-        sessions = [s for s in sessions if not s["isSubAgent"]]
-    elif type == "agent":
-        sessions = [s for s in sessions if s["isSubAgent"]]
-
-    # Group by day
-    from datetime import timedelta
-    now = datetime.now(timezone.utc)
-    cutoff = now - timedelta(days=days)
-
-    daily_map: dict[str, dict] = {}
-
-    for session in sessions:
-        if not session["startTime"] or session["startTime"] < cutoff:
-            continue
-
-        date_str = session["startTime"].strftime("%Y-%m-%d")
-        if date_str not in daily_map:
-            daily_map[date_str] = {"sessions": [], "total_messages": 0}
-
-        daily_map[date_str]["sessions"].append(session)
-        daily_map[date_str]["total_messages"] += session["messageCount"]
-
-    # Convert to response format
+    # Convert to response format, filling in subAgentIds and formatting
+    # times on the grouped session dicts in place
     daily_activity = []
     for date, data in sorted(daily_map.items(), reverse=True):
+        for session in data["sessions"]:
+            if not session["isSubAgent"]:
+                agent_ids = parent_to_agents.get(session["id"], [])
+                session["subAgentIds"] = agent_ids if agent_ids else None
+            session["startTime"] = session["startTime"].isoformat()
+            if session["endTime"]:
+                session["endTime"] = session["endTime"].isoformat()
         daily_activity.append({
             "date": date,
-            "sessions": [
-                {
-                    **s,
-                    "startTime": s["startTime"].isoformat(),
-                    "endTime": s["endTime"].isoformat() if s["endTime"] else None,
-                }
-                for s in data["sessions"]
-            ],
+            "sessions": data["sessions"],
             "totalMessages": data["total_messages"],
             "sessionCount": len(data["sessions"]),
         })
@@ -1138,11 +1571,13 @@ async def get_activity(
     total_messages = sum(d["totalMessages"] for d in daily_activity)
     max_daily_messages = max((d["totalMessages"] for d in daily_activity), default=0)
 
-    return {
+    # Days and sessions are built field-for-field in the response schema, so
+    # skip revalidating and re-encoding them
+    return ORJSONResponse({
         "data": daily_activity,
         "summary": {
             "totalSessions": total_sessions,
             "totalMessages": total_messages,
             "maxDailyMessages": max_daily_messages,
         },
-    }
+    })
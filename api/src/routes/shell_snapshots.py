@@ -4,12 +4,14 @@ Shell snapshots capture shell environment state with filename format
 snapshot-{shell}-{timestamp}-{random}.sh
 """
 
+import asyncio
+import os
 from urllib.parse import unquote
 
 from fastapi import APIRouter, HTTPException, Path
 
 from ..models import ShellSnapshot
-from ..utils import get_claude_dir, parse_shell_snapshot_filename
+from ..utils import get_claude_dir, get_claude_dir_resolved, parse_shell_snapshot_filename
 
 router = APIRouter(prefix="/shell-snapshots", tags=["shell-snapshots"])
 
@@ -34,9 +36,9 @@ async def list_shell_snapshots() -> dict[str, list[ShellSnapshot]]:
         return {"data": []}
 
     snapshots = []
-    for f in snapshots_dir.iterdir():
-        if f.suffix == ".sh":
-            snapshot = parse_shell_snapshot_filename(f.name)
+    for name in await asyncio.to_thread(os.listdir, snapshots_dir):
+        if name.endswith(".sh"):
+            snapshot = parse_shell_snapshot_filename(name)
             snapshots.append(snapshot)
 
     # Sort by timestamp descending
@@ -66,15 +68,15 @@ async def get_shell_snapshot(
         404: Shell snapshot not found
     """
     filename = unquote(filename)
-    claude_dir = get_claude_dir()
-    snapshot_path = claude_dir / "shell-snapshots" / filename
+    snapshots_dir = get_claude_dir_resolved() / "shell-snapshots"
+    snapshot_path = (snapshots_dir / filename).resolve()
 
-    # Security check
-    if not str(snapshot_path).startswith(str(claude_dir / "shell-snapshots")):
+    # Security: resolve ".." and symlinks before checking containment
+    if not snapshot_path.is_relative_to(snapshots_dir):
         raise HTTPException(status_code=400, detail="Invalid filename")
 
     if not snapshot_path.exists():
         raise HTTPException(status_code=404, detail="Shell snapshot not found")
 
-    content = snapshot_path.read_text()
+    content = await asyncio.to_thread(snapshot_path.read_text)
     return {"filename": filename, "content": content}
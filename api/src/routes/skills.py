@@ -5,6 +5,8 @@ a SKILL.md file with YAML frontmatter defining name, description,
 and allowed-tools. Invoked with /skill-name.
 """
 
+import asyncio
+import os
 from pathlib import Path
 from urllib.parse import unquote
 
@@ -17,37 +19,56 @@ from ..utils import get_claude_dir, parse_yaml_frontmatter
 router = APIRouter(prefix="/skills", tags=["skills"])
 
 
-async def get_skill_info(skill_path: Path, name: str) -> dict:
-    """Get skill information from a skill directory."""
+def _read_skill_info(skill_path: Path, name: str, is_symlink: bool | None = None) -> dict:
+    """Get skill information from a skill directory.
+
+    is_symlink can be passed from a scandir entry to skip the lstat.
+    """
     skill = {"name": name}
+    if is_symlink is None:
+        is_symlink = skill_path.is_symlink()
 
     # Check if symlink
-    if skill_path.is_symlink():
+    if is_symlink:
         skill["isSymlink"] = True
         try:
             skill["realPath"] = str(skill_path.resolve())
         except Exception:
             pass
 
-    # Try to read SKILL.md for description
-    actual_path = skill_path.resolve() if skill_path.is_symlink() else skill_path
-    skill_md_path = actual_path / "SKILL.md"
-
-    if skill_md_path.exists():
-        try:
-            content = skill_md_path.read_text()
-            frontmatter = parse_yaml_frontmatter(content)
-            if frontmatter.get("description"):
-                skill["description"] = frontmatter["description"]
-            if frontmatter.get("allowed_tools"):
-                skill["allowedTools"] = frontmatter["allowed_tools"]
-            skill["content"] = content
-        except Exception:
-            pass
+    # Read SKILL.md for description in one open; the kernel follows any symlink
+    try:
+        content = (skill_path / "SKILL.md").read_text()
+    except Exception:
+        return skill
+
+    try:
+        frontmatter = parse_yaml_frontmatter(content)
+        if frontmatter.get("description"):
+            skill["description"] = frontmatter["description"]
+        if frontmatter.get("allowed_tools"):
+            skill["allowedTools"] = frontmatter["allowed_tools"]
+        skill["content"] = content
+    except Exception:
+        pass
 
     return skill
 
 
+async def get_skill_info(skill_path: Path, name: str, is_symlink: bool | None = None) -> dict:
+    """Get skill information from a skill directory."""
+    return await asyncio.to_thread(_read_skill_info, skill_path, name, is_symlink)
+
+
+def _list_skill_dirs(skills_dir: Path) -> list[os.DirEntry]:
+    """List skill directories, including symlinked ones.
+
+    scandir reports entry types from the directory read, without a stat per entry.
+    """
+    with os.scandir(skills_dir) as it:
+        return [entry for entry in it if entry.is_dir(follow_symlinks=False) or entry.is_symlink()]
+
+
 @router.get("/")
 async def list_skills() -> dict[str, list[Skill]]:
     """List all skills.
@@ -67,13 +88,13 @@ async def list_skills() -> dict[str, list[Skill]]:
     if not skills_dir.exists():
         return {"data": []}
 
-    skills = []
-    for entry in skills_dir.iterdir():
-        if entry.is_dir() or entry.is_symlink():
-            skill = await get_skill_info(entry, entry.name)
-            # For list, don't include full content
-            skill.pop("content", None)
-            skills.append(skill)
+    entries = await asyncio.to_thread(_list_skill_dirs, skills_dir)
+    skills = await asyncio.gather(*(
+        get_skill_info(Path(entry.path), entry.name, entry.is_symlink()) for entry in entries
+    ))
+    for skill in skills:
+        # For list, don't include full content
+        skill.pop("content", None)
 
     return {"data": skills}
 
@@ -103,11 +124,12 @@ async def get_skill(
         404: Skill not found
     """
     name = unquote(name)
-    claude_dir = get_claude_dir()
-    skill_path = claude_dir / "skills" / name
+    skills_dir = get_claude_dir() / "skills"
+    skill_path = skills_dir / name
 
-    # Security check
-    if not str(skill_path).startswith(str(claude_dir / "skills")):
+    # Security: skills may be symlinks to external directories, so ".." is
+    # normalized lexically and the skill must be a direct child of skills/
+    if Path(os.path.normpath(skill_path)).parent != skills_dir:
         raise HTTPException(status_code=400, detail="Invalid skill name")
 
     if not skill_path.exists():
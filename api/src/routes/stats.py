@@ -4,24 +4,142 @@ Provides aggregated usage statistics from cached stats
 and computed metrics from session files.
 """
 
-import json
-from datetime import datetime
+import asyncio
+import heapq
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
+from typing import Literal
 
+import orjson
 from fastapi import APIRouter, Query
+from fastapi.responses import ORJSONResponse
 
 from ..models import DailyActivity, DailyActivityResponse, ModelUsage, ModelUsageResponse, Stats
-from ..utils import get_claude_config_path, get_claude_dir, parse_jsonl_file
+from ..utils import get_claude_config, get_claude_dir, iter_jsonl_file
+from .projects import SESSION_IO_CONCURRENCY, get_session_bounds
 
 router = APIRouter(prefix="/stats", tags=["stats"])
 
+logger = logging.getLogger(__name__)
+
+# Caps concurrent transcript reads, as for the project listings
+_count_slots = asyncio.Semaphore(SESSION_IO_CONCURRENCY)
+
+
+def _list_project_dirs(projects_dir: Path) -> list[str]:
+    """List project directory paths, using scandir's entry types instead of a stat each."""
+    with os.scandir(projects_dir) as it:
+        return [entry.path for entry in it if entry.is_dir()]
+
+
+def _list_transcripts(project_dir: str) -> list[os.DirEntry]:
+    """List a project's .jsonl transcripts as scandir entries."""
+    try:
+        with os.scandir(project_dir) as it:
+            return [entry for entry in it if entry.name.endswith(".jsonl")]
+    except OSError:
+        return []
+
+
+def _walk_transcripts(projects_dir: Path) -> list[tuple[str, os.DirEntry]]:
+    """List (project ID, entry) for every transcript under the projects directory."""
+    return [
+        (os.path.basename(project_dir), file)
+        for project_dir in _list_project_dirs(projects_dir)
+        for file in _list_transcripts(project_dir)
+    ]
+
+
+@lru_cache(maxsize=4096)
+def _count_tool_calls(path: str, mtime_ns: int, size: int) -> int:
+    """Count a transcript's tool calls (blocking).
+
+    Only lines mentioning "tool_use" can hold tool calls, so just those are
+    decoded. Counts up to an unreadable or malformed point are kept.
+    mtime_ns and size are part of the cache key only.
+    """
+    tool_calls = 0
+    try:
+        for parsed in iter_jsonl_file(Path(path), contains=b'"tool_use"'):
+            if parsed.get("type") == "assistant":
+                msg_content = parsed.get("message", {}).get("content", [])
+                if isinstance(msg_content, list):
+                    for block in msg_content:
+                        if isinstance(block, dict) and block.get("type") == "tool_use":
+                            tool_calls += 1
+    except Exception:
+        pass
+    return tool_calls
+
+
+async def _count_tool_calls_async(path: str, stat: os.stat_result) -> int:
+    """Count a transcript's tool calls in a worker thread."""
+    async with _count_slots:
+        return await asyncio.to_thread(_count_tool_calls, path, stat.st_mtime_ns, stat.st_size)
+
+
+# Claude Code's own stats-cache.json is preferred; when it's missing, basic
+# stats are recomputed in the background and served from memory
+STATS_REFRESH_INTERVAL_SECONDS = 60
+_computed_stats: dict | None = None
+
+
+async def compute_basic_stats() -> dict:
+    """Compute basic stats by scanning session files."""
+    projects_dir = get_claude_dir() / "projects"
+    if not projects_dir.exists():
+        return {
+            "version": 1,
+            "lastComputedDate": datetime.now().strftime("%Y-%m-%d"),
+            "totalSessions": 0,
+            "totalMessages": 0,
+        }
+
+    transcripts = _walk_transcripts(projects_dir)
+
+    # Message counts come from the cached session bounds, read concurrently
+    # in worker threads; /stats/daily reuses the same cache
+    all_bounds = await asyncio.gather(*(
+        get_session_bounds(project_id, file.name) for project_id, file in transcripts
+    ))
+
+    return {
+        "version": 1,
+        "lastComputedDate": datetime.now().strftime("%Y-%m-%d"),
+        "totalSessions": len(transcripts),
+        "totalMessages": sum(bounds["message_count"] for bounds in all_bounds),
+    }
+
+
+async def run_stats_refresh() -> None:
+    """Keep computed stats fresh while there is no stats-cache.json, until cancelled.
+
+    A failed refresh is logged and drops the computed stats, so requests
+    compute them directly until the next refresh succeeds.
+    """
+    global _computed_stats
+    while True:
+        try:
+            if not (get_claude_dir() / "stats-cache.json").exists():
+                _computed_stats = await compute_basic_stats()
+        except Exception:
+            logger.exception("Failed to compute basic stats")
+            _computed_stats = None
+        await asyncio.sleep(STATS_REFRESH_INTERVAL_SECONDS)
+
 
 @router.get("/", response_model=Stats)
 async def get_stats() -> Stats:
     """Get aggregated usage statistics.
 
-    Returns cached stats if available. If no cache exists, computes
-    basic stats by scanning session files.
+    Returns cached stats if available. If no cache exists, returns basic
+    stats computed in the background by scanning session files (or
+    computes them now if the first refresh hasn't finished).
 
     Stats include:
     - totalSessions: Count of all session files
@@ -33,54 +151,18 @@ async def get_stats() -> Stats:
     Returns:
         Stats object with usage metrics
     """
-    claude_dir = get_claude_dir()
-    stats_path = claude_dir / "stats-cache.json"
+    stats_path = get_claude_dir() / "stats-cache.json"
 
     # Try to read cached stats
     if stats_path.exists():
         try:
-            content = stats_path.read_text()
-            return json.loads(content)
+            return orjson.loads(await asyncio.to_thread(stats_path.read_bytes))
         except Exception:
             pass
 
-    # Compute basic stats
-    projects_dir = claude_dir / "projects"
-    if not projects_dir.exists():
-        return {
-            "version": 1,
-            "lastComputedDate": datetime.now().strftime("%Y-%m-%d"),
-            "totalSessions": 0,
-            "totalMessages": 0,
-        }
-
-    total_sessions = 0
-    total_messages = 0
-
-    for project_dir in projects_dir.iterdir():
-        if not project_dir.is_dir():
-            continue
-
-        for file in project_dir.iterdir():
-            if file.suffix != ".jsonl":
-                continue
-            total_sessions += 1
-
-            try:
-                content = file.read_text()
-                lines = parse_jsonl_file(content)
-                for parsed in lines:
-                    if parsed.get("type") != "file-history-snapshot":
-                        total_messages += 1
-            except Exception:
-                continue
-
-    return {
-        "version": 1,
-        "lastComputedDate": datetime.now().strftime("%Y-%m-%d"),
-        "totalSessions": total_sessions,
-        "totalMessages": total_messages,
-    }
+    if _computed_stats is not None:
+        return _computed_stats
+    return await compute_basic_stats()
 
 
 @router.get("/daily", response_model=DailyActivityResponse)
@@ -100,6 +182,10 @@ async def get_daily_stats(
         le=100,
         description="Maximum number of days to return (max 100)"
     ),
+    metrics: list[Literal["messageCount", "sessionCount", "toolCallCount"]] = Query(
+        ["messageCount", "sessionCount", "toolCallCount"],
+        description="Counts to compute; others are returned as 0. sessionCount alone needs no file reads. Can specify multiple."
+    ),
 ) -> DailyActivityResponse:
     """Get daily activity breakdown.
 
@@ -108,6 +194,9 @@ async def get_daily_stats(
 
     Results are sorted by date descending (most recent first).
 
+    Session counts come from file metadata alone, so requesting only
+    sessionCount skips reading the transcripts.
+
     Returns:
         data: List of DailyActivity objects with date, messageCount,
               sessionCount, and toolCallCount
@@ -115,65 +204,84 @@ async def get_daily_stats(
     claude_dir = get_claude_dir()
     projects_dir = claude_dir / "projects"
 
-    start_dt = datetime.fromisoformat(start_date) if start_date else None
-    end_dt = datetime.fromisoformat(end_date) if end_date else None
+    # The range is compared as epoch bounds on raw mtimes: local midnight of
+    # the first included day up to local midnight after the last one
+    start_ts = float("-inf")
+    if start_date:
+        start_dt = datetime.fromisoformat(start_date)
+        start_day = start_dt.replace(hour=0, minute=0, second=0, microsecond=0)
+        if start_day < start_dt:
+            start_day += timedelta(days=1)
+        start_ts = start_day.timestamp()
+    end_ts = float("inf")
+    if end_date:
+        end_day = datetime.fromisoformat(end_date).replace(hour=0, minute=0, second=0, microsecond=0)
+        end_ts = (end_day + timedelta(days=1)).timestamp()
 
     daily_stats: dict[str, dict] = {}
 
     if not projects_dir.exists():
         return {"data": []}
 
-    for project_dir in projects_dir.iterdir():
-        if not project_dir.is_dir():
+    # (date, project ID, entry, stat) of each transcript in range, counted after the walk
+    counted: list[tuple[str, str, os.DirEntry, os.stat_result]] = []
+    for project_id, file in _walk_transcripts(projects_dir):
+        try:
+            stat = file.stat()
+        except OSError:
+            continue
+        if not start_ts <= stat.st_mtime < end_ts:
             continue
 
-        for file in project_dir.iterdir():
-            if file.suffix != ".jsonl":
-                continue
-
-            try:
-                stat = file.stat()
-                date = datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d")
-
-                if start_dt and datetime.fromisoformat(date) < start_dt:
-                    continue
-                if end_dt and datetime.fromisoformat(date) > end_dt:
-                    continue
-
-                if date not in daily_stats:
-                    daily_stats[date] = {
-                        "messageCount": 0,
-                        "sessionCount": 0,
-                        "toolCallCount": 0,
-                    }
-
-                daily_stats[date]["sessionCount"] += 1
-
-                content = file.read_text()
-                lines = parse_jsonl_file(content)
-
-                for parsed in lines:
-                    if parsed.get("type") == "file-history-snapshot":
-                        continue
-                    daily_stats[date]["messageCount"] += 1
-
-                    # Count tool calls
-                    if parsed.get("type") == "assistant":
-                        msg_content = parsed.get("message", {}).get("content", [])
-                        if isinstance(msg_content, list):
-                            for block in msg_content:
-                                if isinstance(block, dict) and block.get("type") == "tool_use":
-                                    daily_stats[date]["toolCallCount"] += 1
-            except Exception:
-                continue
-
-    # Convert to sorted array
-    data = [
-        {"date": date, **stats}
-        for date, stats in sorted(daily_stats.items(), reverse=True)
-    ][:limit]
-
-    return {"data": data}
+        tm = time.localtime(stat.st_mtime)
+        date = f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+
+        if date not in daily_stats:
+            daily_stats[date] = {
+                "messageCount": 0,
+                "sessionCount": 0,
+                "toolCallCount": 0,
+            }
+
+        if "sessionCount" in metrics:
+            daily_stats[date]["sessionCount"] += 1
+        counted.append((date, project_id, file, stat))
+
+    # Only the most recent days are returned (ISO dates sort lexicographically),
+    # so transcripts from older days are never read
+    days = dict(heapq.nlargest(limit, daily_stats.items(), key=itemgetter(0)))
+    counted = [item for item in counted if item[0] in days]
+
+    # Message counts come from the cached session bounds; tool calls are
+    # counted from the few lines that mention them. Both run in worker threads,
+    # and only when requested.
+    async def no_counts() -> list:
+        return []
+
+    all_bounds, tool_calls = await asyncio.gather(
+        asyncio.gather(*(
+            get_session_bounds(project_id, file.name, stat.st_mtime_ns, stat.st_size)
+            for _, project_id, file, stat in counted
+        )) if "messageCount" in metrics else no_counts(),
+        asyncio.gather(*(
+            _count_tool_calls_async(file.path, stat) for _, _, file, stat in counted
+        )) if "toolCallCount" in metrics else no_counts(),
+    )
+    for (date, _, _, _), bounds in zip(counted, all_bounds):
+        days[date]["messageCount"] += bounds["message_count"]
+    for (date, _, _, _), calls in zip(counted, tool_calls):
+        days[date]["toolCallCount"] += calls
+
+    # nlargest already ordered the days, most recent first
+    data = [{"date": date, **stats} for date, stats in days.items()]
+
+    # Rows are built field-for-field in the response schema, so skip revalidating them
+    return ORJSONResponse({"data": data})
+
+
+# Token usage summed from the shared parsed config, as (config, usage); rebuilt
+# when the config is re-read after ~/.claude.json changes
+_model_usage_cache: tuple[dict, dict] | None = None
 
 
 @router.get("/models", response_model=ModelUsageResponse)
@@ -193,10 +301,12 @@ async def get_model_stats() -> ModelUsageResponse:
         data: Dictionary mapping model ID (e.g., 'claude-opus-4-5-20251101')
               to ModelUsage with token counts
     """
+    global _model_usage_cache
+
     try:
-        config_path = get_claude_config_path()
-        content = config_path.read_text()
-        config = json.loads(content)
+        config = await get_claude_config()
+        if _model_usage_cache and _model_usage_cache[0] is config:
+            return {"data": _model_usage_cache[1]}
 
         model_usage: dict[str, dict] = {}
         projects = config.get("projects", {})
@@ -216,6 +326,7 @@ async def get_model_stats() -> ModelUsageResponse:
                 model_usage[model]["cacheReadInputTokens"] += stats.get("cacheReadInputTokens", 0)
                 model_usage[model]["cacheCreationInputTokens"] += stats.get("cacheCreationInputTokens", 0)
 
+        _model_usage_cache = (config, model_usage)
         return {"data": model_usage}
     except Exception:
         return {"data": {}}
@@ -0,0 +1,329 @@
+"""Persistent session index for Claude Explorer API.
+
+Session bounds (start/end time, message count, model) are derived by
+parsing each JSONL transcript, which is the dominant cost of the activity
+endpoints. This module keeps those bounds in a SQLite sidecar database at
+~/.claude/.explorer_index.db, keyed by transcript mtime and size, so a
+transcript is only re-parsed when it changes, including across restarts.
+
+Timestamps are stored as ISO 8601 strings. Claude Code writes UTC
+timestamps, so lexical order matches chronological order for range queries.
+"""
+
+import logging
+import asyncio
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Literal
+
+import orjson
+
+from .utils import get_claude_dir
+
+INDEX_FILENAME = ".explorer_index.db"
+
+# Bump when the schema changes; older index files are rebuilt from scratch
+SCHEMA_VERSION = 4
+
+SCHEMA = """
+DROP TABLE IF EXISTS sessions;
+CREATE TABLE sessions (
+    project_id TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    is_agent INTEGER NOT NULL,
+    start_ts TEXT,
+    end_ts TEXT,
+    msg_count INTEGER NOT NULL,
+    model TEXT,
+    message_model TEXT,
+    tools_used TEXT NOT NULL,
+    file_mtime INTEGER NOT NULL,
+    file_size INTEGER NOT NULL,
+    PRIMARY KEY (project_id, session_id)
+);
+CREATE INDEX idx_sessions_start_ts ON sessions (start_ts);
+CREATE INDEX idx_sessions_project_id ON sessions (project_id);
+CREATE INDEX idx_sessions_session_id ON sessions (session_id);
+"""
+
+logger = logging.getLogger(__name__)
+
+_connection: sqlite3.Connection | None = None
+
+# The connection is shared between the event loop and worker threads, so every
+# use holds _connection_lock; refreshes are also serialized so one never
+# commits another's partial writes
+_connection_lock = threading.Lock()
+_refresh_lock = asyncio.Lock()
+
+# Bumped whenever a refresh changes rows, so results built from the index can
+# be checked for staleness
+_index_generation = 0
+
+
+def _ensure_schema(conn: sqlite3.Connection) -> None:
+    """Create the index tables, replacing any built with an older schema."""
+    (version,) = conn.execute("PRAGMA user_version").fetchone()
+    if version != SCHEMA_VERSION:
+        conn.executescript(SCHEMA)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+def get_index_connection() -> sqlite3.Connection:
+    """Open (once) the session index database, creating the schema if needed.
+
+    Falls back to an in-memory database when the index file cannot be
+    created, so the API keeps working on a read-only ~/.claude. The
+    connection is shared with lookups running in worker threads; callers
+    must hold _connection_lock while using it.
+    """
+    global _connection
+
+    if _connection is None:
+        try:
+            conn = sqlite3.connect(get_claude_dir() / INDEX_FILENAME, check_same_thread=False)
+            _ensure_schema(conn)
+        except sqlite3.Error:
+            logger.warning(
+                "Cannot open the session index at %s; using an in-memory index",
+                get_claude_dir() / INDEX_FILENAME,
+                exc_info=True,
+            )
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+            _ensure_schema(conn)
+        _connection = conn
+
+    return _connection
+
+
+async def refresh_session_index() -> None:
+    """Bring the index up to date with the transcripts on disk.
+
+    Transcripts whose mtime and size match the indexed row are skipped; new or
+    modified transcripts are parsed and upserted, and rows for deleted
+    transcripts are removed. Changes are written in a single transaction
+    once every transcript has been parsed.
+    """
+    async with _refresh_lock:
+        await _refresh_session_index()
+
+
+def get_index_generation() -> int:
+    """Get a counter that changes whenever a refresh changes the index."""
+    return _index_generation
+
+
+def _find_changed_transcripts() -> tuple[list[tuple[str, str, str, int, int]], set[tuple[str, str]]]:
+    """Diff the transcripts on disk against the index (blocking).
+
+    Returns (project ID, session ID, filename, mtime_ns, size) of new or
+    modified transcripts, and the (project ID, session ID) keys of indexed
+    transcripts that no longer exist.
+    """
+    projects_dir = get_claude_dir() / "projects"
+
+    with _connection_lock:
+        indexed = {
+            (project_id, session_id): (file_mtime, file_size)
+            for project_id, session_id, file_mtime, file_size in get_index_connection().execute(
+                "SELECT project_id, session_id, file_mtime, file_size FROM sessions"
+            )
+        }
+    seen = set()
+    changed: list[tuple[str, str, str, int, int]] = []
+
+    if projects_dir.exists():
+        # scandir yields names and types from the directory read, without Path objects
+        try:
+            with os.scandir(projects_dir) as project_entries:
+                project_dirs = [(e.name, e.path) for e in project_entries if e.is_dir()]
+        except OSError:
+            project_dirs = []
+
+        for project_id, project_path in project_dirs:
+            try:
+                with os.scandir(project_path) as entries:
+                    files = [e for e in entries if e.name.endswith(".jsonl")]
+            except OSError:
+                continue
+
+            for file in files:
+                key = (project_id, file.name[:-6])
+                try:
+                    stat = file.stat()
+                except OSError:
+                    continue
+                mtime_ns, size = stat.st_mtime_ns, stat.st_size
+                seen.add(key)
+
+                if indexed.get(key) != (mtime_ns, size):
+                    changed.append((project_id, key[1], file.name, mtime_ns, size))
+
+    return changed, indexed.keys() - seen
+
+
+def _write_index_rows(rows: list[tuple], deleted: set[tuple[str, str]]) -> None:
+    """Upsert and delete index rows in a single transaction (blocking)."""
+    with _connection_lock:
+        conn = get_index_connection()
+        conn.executemany(
+            "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+        )
+        conn.executemany(
+            "DELETE FROM sessions WHERE project_id = ? AND session_id = ?", deleted
+        )
+        conn.commit()
+
+
+async def _refresh_session_index() -> None:
+    """Refresh the index; callers must hold _refresh_lock.
+
+    The directory walk and the write run in worker threads; only gathering
+    bounds for changed transcripts happens on the event loop.
+    """
+    global _index_generation
+    from .routes.projects import get_session_bounds
+
+    changed, deleted = await asyncio.to_thread(_find_changed_transcripts)
+
+    all_bounds = await asyncio.gather(*(
+        get_session_bounds(project_id, filename, mtime_ns, size)
+        for project_id, _, filename, mtime_ns, size in changed
+    ))
+    rows = [
+        (
+            project_id,
+            session_id,
+            filename.startswith("agent-"),
+            bounds["start_time"].isoformat() if bounds["start_time"] else None,
+            bounds["end_time"].isoformat() if bounds["end_time"] else None,
+            bounds["message_count"],
+            bounds.get("model"),
+            bounds.get("message_model"),
+            orjson.dumps(sorted(bounds.get("tools_used", ()))).decode(),
+            mtime_ns,
+            size,
+        )
+        for (project_id, session_id, filename, mtime_ns, size), bounds in zip(changed, all_bounds)
+    ]
+
+    # Rows are written together, so the transaction holds only this refresh's writes
+    await asyncio.to_thread(_write_index_rows, rows, deleted)
+    if rows or deleted:
+        _index_generation += 1
+
+
+async def warm_session_index() -> None:
+    """Build the index in the background at startup, logging rather than raising errors."""
+    try:
+        await refresh_session_index()
+    except Exception:
+        logger.exception("Failed to build the session index")
+
+
+def lookup_session_bounds(
+    project_id: str, session_id: str, mtime_ns: int, size: int
+) -> dict[str, Any] | None:
+    """Get a transcript's indexed bounds, if the index has this exact version.
+
+    Lets a fresh process answer listings from the index instead of parsing
+    every transcript again. Returns None when the row is missing or stale.
+    """
+    with _connection_lock:
+        row = get_index_connection().execute(
+            "SELECT start_ts, end_ts, msg_count, model, message_model, tools_used FROM sessions"
+            " WHERE project_id = ? AND session_id = ? AND file_mtime = ? AND file_size = ?",
+            (project_id, session_id, mtime_ns, size),
+        ).fetchone()
+    if row is None:
+        return None
+
+    start_ts, end_ts, msg_count, model, message_model, tools_used = row
+    return {
+        "start_time": datetime.fromisoformat(start_ts) if start_ts else None,
+        "end_time": datetime.fromisoformat(end_ts) if end_ts else None,
+        "message_count": msg_count,
+        "model": model,
+        "message_model": message_model,
+        "tools_used": set(orjson.loads(tools_used)),
+    }
+
+
+def lookup_message_counts(project_id: str) -> dict[str, tuple[int, int, int]]:
+    """Get indexed message counts for a project's transcripts.
+
+    Returns session ID -> (file mtime_ns, file size, message count), so
+    callers can use the count only where the transcript is unchanged.
+    """
+    with _connection_lock:
+        rows = get_index_connection().execute(
+            "SELECT session_id, file_mtime, file_size, msg_count FROM sessions WHERE project_id = ?",
+            (project_id,),
+        ).fetchall()
+    return {session_id: (mtime_ns, size, count) for session_id, mtime_ns, size, count in rows}
+
+
+def lookup_session_project(session_id: str) -> str | None:
+    """Get the project ID holding a session's transcript.
+
+    Reads the index as of its last refresh without refreshing it, so callers
+    should confirm the transcript still exists.
+    """
+    with _connection_lock:
+        row = get_index_connection().execute(
+            "SELECT project_id FROM sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+    return row[0] if row else None
+
+
+async def query_sessions(
+    start_dt: datetime,
+    end_dt: datetime,
+    type: Literal["regular", "agent", "all"] = "all",
+    refresh: bool = True,
+) -> list[dict[str, Any]]:
+    """Get indexed sessions whose start time falls within a date range.
+
+    The index is refreshed first so results reflect the current transcripts,
+    unless the caller has just refreshed it.
+
+    Args:
+        start_dt: Inclusive lower bound on session start time
+        end_dt: Inclusive upper bound on session start time
+        type: 'regular' (main sessions), 'agent' (sub-agents), or 'all'
+        refresh: Refresh the index before querying
+
+    Returns:
+        Rows with project_id, session_id, is_agent, start_time, end_time
+        (ISO 8601 strings), message_count and model, grouped by project and ordered
+        by transcript mtime descending within each project
+    """
+    if refresh:
+        await refresh_session_index()
+
+    query = (
+        "SELECT project_id, session_id, is_agent, start_ts, end_ts, msg_count, model"
+        " FROM sessions WHERE start_ts BETWEEN ? AND ?"
+    )
+    params: list[Any] = [start_dt.isoformat(), end_dt.isoformat()]
+    if type != "all":
+        query += " AND is_agent = ?"
+        params.append(type == "agent")
+    query += " ORDER BY project_id, file_mtime DESC"
+
+    with _connection_lock:
+        rows = get_index_connection().execute(query, params).fetchall()
+    return [
+        {
+            "project_id": project_id,
+            "session_id": session_id,
+            "is_agent": bool(is_agent),
+            "start_time": start_ts,
+            "end_time": end_ts,
+            "message_count": msg_count,
+            "model": model,
+        }
+        for project_id, session_id, is_agent, start_ts, end_ts, msg_count, model in rows
+    ]
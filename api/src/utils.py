@@ -1,10 +1,15 @@
 """Utility functions for Claude Explorer API."""
 
-import json
+import mmap
+import os
 import re
+import time
+from functools import lru_cache, wraps
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Awaitable, Callable, Iterable, Iterator
+
+import orjson
 
 
 def get_claude_dir() -> Path:
@@ -12,11 +17,18 @@ def get_claude_dir() -> Path:
     return Path.home() / ".claude"
 
 
+@lru_cache(maxsize=1)
+def get_claude_dir_resolved() -> Path:
+    """Get the ~/.claude directory with symlinks resolved, for containment checks."""
+    return get_claude_dir().resolve()
+
+
 def get_claude_config_path() -> Path:
     """Get the path to the ~/.claude.json config file."""
     return Path.home() / ".claude.json"
 
 
+@lru_cache(maxsize=2048)
 def decode_project_path(encoded: str) -> str:
     """Decode a project path from the encoded format."""
     if encoded.startswith("-"):
@@ -24,12 +36,16 @@ def decode_project_path(encoded: str) -> str:
     return encoded.replace("-", "/")
 
 
+_NON_ALNUM_RE = re.compile(r"[^a-zA-Z0-9]")
+
+
+@lru_cache(maxsize=256)
 def encode_project_path(path: str) -> str:
     """Encode a project path to match Claude Code's directory naming.
 
     Claude Code replaces all non-alphanumeric characters with -.
     """
-    return re.sub(r"[^a-zA-Z0-9]", "-", path)
+    return _NON_ALNUM_RE.sub("-", path)
 
 
 def get_display_path(path: str) -> str:
@@ -46,7 +62,6 @@ def normalize_path_prefix(path: str) -> str:
     - Expands ~ to home directory
     - Removes trailing slashes
     """
-    import os
     return os.path.expanduser(path).rstrip("/")
 
 
@@ -56,14 +71,80 @@ def get_project_name(path: str) -> str:
     return parts[-1] if parts else path
 
 
-async def get_claude_config() -> dict[str, Any]:
-    """Read and parse the ~/.claude.json config file."""
+# Parsed ~/.claude.json and its path lookup: ((mtime_ns, size), config, lookup)
+_claude_config_cache: tuple[tuple[int, int], dict[str, Any], dict[str, str]] | None = None
+
+
+def _load_claude_config() -> tuple[dict[str, Any], dict[str, str]]:
+    """Read the config and build its path lookup, reusing both until the file changes."""
+    global _claude_config_cache
+
     try:
         config_path = get_claude_config_path()
-        content = config_path.read_text()
-        return json.loads(content)
+        stat = config_path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        if _claude_config_cache and _claude_config_cache[0] == key:
+            return _claude_config_cache[1], _claude_config_cache[2]
+
+        config = orjson.loads(config_path.read_bytes())
+        lookup = build_path_lookup(config)
+        _claude_config_cache = (key, config, lookup)
+        return config, lookup
     except Exception:
-        return {}
+        return {}, {}
+
+
+async def get_claude_config() -> dict[str, Any]:
+    """Read and parse the ~/.claude.json config file.
+
+    The parsed config is shared between callers and must not be modified.
+    """
+    return _load_claude_config()[0]
+
+
+async def get_path_lookup() -> dict[str, str]:
+    """Get the encoded-path to real-path lookup for the current config."""
+    return _load_claude_config()[1]
+
+
+async def get_claude_config_and_lookup() -> tuple[dict[str, Any], dict[str, str]]:
+    """Get the config and its path lookup together, checking the file once."""
+    return _load_claude_config()
+
+
+# Sensitive fields to redact from config
+SENSITIVE_FIELDS = [
+    "oauthaccount",
+    "accesstoken",
+    "refreshtoken",
+    "apikey",
+    "credentials",
+    "token",
+    "secret",
+]
+
+# Exact-match fast path, then a single compiled scan for substring matches
+SENSITIVE_SET = frozenset(SENSITIVE_FIELDS)
+_SENSITIVE_RE = re.compile("|".join(map(re.escape, SENSITIVE_FIELDS)))
+
+
+def redact_sensitive_data(obj: dict[str, Any]) -> dict[str, Any]:
+    """Redact sensitive data from a dictionary."""
+    result = {}
+
+    for key, value in obj.items():
+        # Check if key is sensitive
+        lowered = key.lower()
+        is_sensitive = lowered in SENSITIVE_SET or _SENSITIVE_RE.search(lowered) is not None
+
+        if is_sensitive:
+            result[key] = "[REDACTED]"
+        elif isinstance(value, dict):
+            result[key] = redact_sensitive_data(value)
+        else:
+            result[key] = value
+
+    return result
 
 
 def build_path_lookup(config: dict[str, Any]) -> dict[str, str]:
@@ -90,29 +171,130 @@ def extract_cwd_from_project_dir(project_dir: Path) -> str | None:
             with open(agent_file) as f:
                 first_line = f.readline()
                 if first_line:
-                    entry = json.loads(first_line)
+                    entry = orjson.loads(first_line)
                     if cwd := entry.get("cwd"):
                         return cwd
-        except (json.JSONDecodeError, OSError):
+        except (orjson.JSONDecodeError, OSError):
             continue
     return None
 
 
 def parse_jsonl_file(content: str) -> list[dict[str, Any]]:
     """Parse a JSONL file content into a list of dictionaries."""
-    lines = content.strip().split("\n")
     results = []
-    for line in lines:
-        line = line.strip()
-        if not line:
+    for line in content.split("\n"):
+        # orjson accepts surrounding whitespace, so only blank lines need a check
+        if not line or line.isspace():
             continue
         try:
-            results.append(json.loads(line))
-        except json.JSONDecodeError:
+            results.append(orjson.loads(line))
+        except orjson.JSONDecodeError:
             continue
     return results
 
 
+def ttl_cache(seconds: float, maxsize: int = 256) -> Callable:
+    """Cache an async function's results per positional arguments for a short time.
+
+    Deduplicates the burst of identical lookups a single page render makes
+    (e.g. /correlated followed by /todos and /debug-logs). Cached values are
+    shared between callers and must not be modified.
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        cache: dict[tuple, tuple[float, Any]] = {}
+
+        @wraps(func)
+        async def wrapper(*args: Any) -> Any:
+            now = time.monotonic()
+            hit = cache.get(args)
+            if hit and now - hit[0] < seconds:
+                return hit[1]
+
+            result = await func(*args)
+            cache.pop(args, None)
+            if len(cache) >= maxsize:
+                # Dicts keep insertion order, so the first key is the oldest
+                del cache[next(iter(cache))]
+            cache[args] = (now, result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def _iter_jsonl_matches(path: Path, needle: bytes) -> Iterator[dict[str, Any]]:
+    """Parse only the lines of a JSONL file that contain needle.
+
+    The file is memory-mapped and searched with mmap.find, jumping from match
+    to match, so non-matching lines are never copied into Python objects.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = mm.find(needle)
+            while pos != -1:
+                start = mm.rfind(b"\n", 0, pos) + 1
+                end = mm.find(b"\n", pos)
+                if end == -1:
+                    end = len(mm)
+                try:
+                    yield orjson.loads(mm[start:end])
+                except orjson.JSONDecodeError:
+                    pass
+                pos = mm.find(needle, end)
+
+
+# Large transcripts are scanned through a memory map instead of buffered reads
+JSONL_MMAP_MIN_BYTES = 1024 * 1024
+
+
+def _iter_mmap_lines(mm: mmap.mmap) -> Iterator[bytes]:
+    """Yield the lines of a memory-mapped file, located with mmap.find."""
+    pos, size = 0, len(mm)
+    while pos < size:
+        end = mm.find(b"\n", pos)
+        if end == -1:
+            end = size
+        yield mm[pos:end]
+        pos = end + 1
+
+
+def _parse_jsonl_lines(lines: Iterable[bytes]) -> Iterator[dict[str, Any]]:
+    """Parse raw JSONL lines, skipping blank and malformed ones."""
+    for line in lines:
+        # orjson accepts surrounding whitespace, so only blank lines need a check
+        if line.isspace() or not line:
+            continue
+        try:
+            yield orjson.loads(line)
+        except orjson.JSONDecodeError:
+            continue
+
+
+def iter_jsonl_file(path: Path, contains: bytes | None = None) -> Iterator[dict[str, Any]]:
+    """Lazily parse a JSONL file line by line.
+
+    Unlike parse_jsonl_file, only one line is held in memory at a time, and
+    callers can stop early without reading the rest of the file.
+
+    Args:
+        path: JSONL file to read
+        contains: If given, only lines containing these bytes are parsed
+    """
+    if contains is not None:
+        yield from _iter_jsonl_matches(path, contains)
+        return
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size >= JSONL_MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield from _parse_jsonl_lines(_iter_mmap_lines(mm))
+        else:
+            yield from _parse_jsonl_lines(f)
+
+
 def parse_timestamp(timestamp: str | int | float | None) -> datetime | None:
     """Parse various timestamp formats into a datetime object."""
     if timestamp is None:
@@ -142,29 +324,42 @@ def parse_timestamp(timestamp: str | int | float | None) -> datetime | None:
     return None
 
 
+_FRONTMATTER_RE = re.compile(r"^---\s*\n([\s\S]*?)\n---")
+_DESCRIPTION_RE = re.compile(r"^description:\s*(.+)$", re.MULTILINE)
+_ALLOWED_TOOLS_RE = re.compile(r"^allowed-tools:\s*(.+)$", re.MULTILINE)
+
+
 def parse_yaml_frontmatter(content: str) -> dict[str, Any]:
     """Parse YAML frontmatter from a markdown file."""
-    match = re.match(r"^---\s*\n([\s\S]*?)\n---", content)
+    match = _FRONTMATTER_RE.match(content)
     if not match:
         return {}
 
     frontmatter = match.group(1)
     result = {}
 
-    desc_match = re.search(r"^description:\s*(.+)$", frontmatter, re.MULTILINE)
+    desc_match = _DESCRIPTION_RE.search(frontmatter)
     if desc_match:
         result["description"] = desc_match.group(1).strip()
 
-    tools_match = re.search(r"^allowed-tools:\s*(.+)$", frontmatter, re.MULTILINE)
+    tools_match = _ALLOWED_TOOLS_RE.search(frontmatter)
     if tools_match:
         result["allowed_tools"] = tools_match.group(1).strip().split()
 
     return result
 
 
+_SNAPSHOT_FILENAME_RE = re.compile(r"^snapshot-(\w+)-(\d+)-\w+\.sh$")
+
+
+@lru_cache(maxsize=8192)
 def parse_shell_snapshot_filename(filename: str) -> dict[str, Any]:
-    """Parse snapshot filename: snapshot-{shell}-{timestamp}-{random}.sh."""
-    match = re.match(r"^snapshot-(\w+)-(\d+)-\w+\.sh$", filename)
+    """Parse snapshot filename: snapshot-{shell}-{timestamp}-{random}.sh.
+
+    Results are cached per filename and shared between callers, so they must
+    not be modified.
+    """
+    match = _SNAPSHOT_FILENAME_RE.match(filename)
     if match:
         return {
             "filename": filename,
@@ -191,10 +386,9 @@ def get_parent_session_id(project_dir: Path, agent_session_id: str) -> str | Non
     if not agent_path.exists():
         return None
     try:
-        content = agent_path.read_text()
-        lines = parse_jsonl_file(content)
-        if lines:
-            return lines[0].get("sessionId")
+        first_msg = next(iter_jsonl_file(agent_path), None)
+        if first_msg:
+            return first_msg.get("sessionId")
     except Exception:
         pass
     return None
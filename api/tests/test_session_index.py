@@ -0,0 +1,135 @@
+"""Tests for the persistent session index."""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+
+import pytest
+
+from src import session_index
+from src.session_index import (
+    INDEX_FILENAME,
+    SCHEMA_VERSION,
+    get_index_connection,
+    get_index_generation,
+    refresh_session_index,
+)
+
+PROJECT_ID = "-tmp-proj"
+
+
+@pytest.fixture
+def claude_dir(tmp_path, monkeypatch):
+    """Point ~/.claude at a temporary directory with a fresh index connection."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(session_index, "_connection", None)
+    claude_dir = tmp_path / ".claude"
+    (claude_dir / "projects" / PROJECT_ID).mkdir(parents=True)
+    yield claude_dir
+    if session_index._connection is not None:
+        session_index._connection.close()
+
+
+def write_transcript(claude_dir, session_id, timestamps, mtime=None):
+    """Write a transcript with one user message per timestamp."""
+    path = claude_dir / "projects" / PROJECT_ID / f"{session_id}.jsonl"
+    with open(path, "w") as f:
+        for i, timestamp in enumerate(timestamps):
+            f.write(json.dumps({
+                "type": "user",
+                "uuid": f"{session_id}-{i}",
+                "sessionId": session_id,
+                "timestamp": timestamp,
+                "message": {"role": "user", "content": "hi"},
+            }) + "\n")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return path
+
+
+def indexed_rows():
+    """Get indexed (project ID, session ID) -> (start_ts, message count)."""
+    rows = get_index_connection().execute(
+        "SELECT project_id, session_id, start_ts, msg_count FROM sessions"
+    )
+    return {(project_id, session_id): (start_ts, count) for project_id, session_id, start_ts, count in rows}
+
+
+def test_refresh_indexes_new_transcripts(claude_dir):
+    write_transcript(claude_dir, "s1", ["2025-01-10T10:00:00Z", "2025-01-10T10:05:00Z"])
+    write_transcript(claude_dir, "agent-a1", ["2025-01-11T08:00:00Z"])
+
+    asyncio.run(refresh_session_index())
+
+    assert indexed_rows() == {
+        (PROJECT_ID, "s1"): ("2025-01-10T10:00:00+00:00", 2),
+        (PROJECT_ID, "agent-a1"): ("2025-01-11T08:00:00+00:00", 1),
+    }
+    (is_agent,) = get_index_connection().execute(
+        "SELECT is_agent FROM sessions WHERE session_id = 'agent-a1'"
+    ).fetchone()
+    assert is_agent == 1
+
+
+def test_refresh_updates_modified_transcripts(claude_dir):
+    write_transcript(claude_dir, "s1", ["2025-01-10T10:00:00Z"], mtime=1_700_000_000)
+    asyncio.run(refresh_session_index())
+
+    write_transcript(claude_dir, "s1", ["2025-01-10T10:00:00Z", "2025-01-10T11:00:00Z"], mtime=1_700_000_100)
+    asyncio.run(refresh_session_index())
+
+    assert indexed_rows() == {(PROJECT_ID, "s1"): ("2025-01-10T10:00:00+00:00", 2)}
+
+
+def test_refresh_removes_deleted_transcripts(claude_dir):
+    write_transcript(claude_dir, "s1", ["2025-01-10T10:00:00Z"])
+    path = write_transcript(claude_dir, "s2", ["2025-01-11T10:00:00Z"])
+    asyncio.run(refresh_session_index())
+
+    path.unlink()
+    asyncio.run(refresh_session_index())
+
+    assert indexed_rows().keys() == {(PROJECT_ID, "s1")}
+
+
+def test_older_schema_is_rebuilt(claude_dir):
+    conn = sqlite3.connect(claude_dir / INDEX_FILENAME)
+    conn.execute("CREATE TABLE sessions (project_id TEXT, session_id TEXT, start_ts TEXT)")
+    conn.execute("INSERT INTO sessions VALUES ('old', 'row', NULL)")
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION - 1}")
+    conn.commit()
+    conn.close()
+
+    write_transcript(claude_dir, "s1", ["2025-01-10T10:00:00Z"])
+    asyncio.run(refresh_session_index())
+
+    (version,) = get_index_connection().execute("PRAGMA user_version").fetchone()
+    assert version == SCHEMA_VERSION
+    assert indexed_rows() == {(PROJECT_ID, "s1"): ("2025-01-10T10:00:00+00:00", 1)}
+
+
+def test_unwritable_index_falls_back_to_memory(claude_dir, caplog):
+    # A directory where the database file should be makes sqlite fail to open it
+    (claude_dir / INDEX_FILENAME).mkdir()
+    write_transcript(claude_dir, "s1", ["2025-01-10T10:00:00Z"])
+
+    with caplog.at_level(logging.WARNING, logger="src.session_index"):
+        asyncio.run(refresh_session_index())
+
+    assert "in-memory index" in caplog.text
+    assert indexed_rows().keys() == {(PROJECT_ID, "s1")}
+
+
+def test_generation_changes_only_when_rows_change(claude_dir):
+    write_transcript(claude_dir, "s1", ["2025-01-10T10:00:00Z"])
+    asyncio.run(refresh_session_index())
+    generation = get_index_generation()
+
+    asyncio.run(refresh_session_index())
+    assert get_index_generation() == generation
+
+    write_transcript(claude_dir, "s2", ["2025-01-11T10:00:00Z"])
+    asyncio.run(refresh_session_index())
+    assert get_index_generation() != generation
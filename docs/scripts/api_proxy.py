@@ -11,6 +11,7 @@ Examples:
     python api_proxy.py /projects/-Users-sam-Projects-foo/sessions/abc123/messages --type user --flatten
 """
 import argparse
+import gzip
 import json
 import sys
 import urllib.error
@@ -21,6 +22,20 @@ BASE_URL = "http://localhost:3001/api/v1"
 DOCS_URL = "http://localhost:3001/docs/llms.txt"
 
 
+def read_body(response) -> bytes:
+    """Read a response body, decompressing it if the server gzipped it."""
+    body = response.read()
+    if response.headers.get("Content-Encoding") == "gzip":
+        body = gzip.decompress(body)
+    return body
+
+
+def open_url(url: str):
+    """Open a URL, accepting gzip-compressed responses."""
+    request = urllib.request.Request(url, headers={"Accept-Encoding": "gzip"})
+    return urllib.request.urlopen(request, timeout=30)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Proxy for Claude Explorer API",
@@ -41,8 +56,8 @@ def main():
     # Handle --docs flag: fetch llms.txt documentation
     if args.docs:
         try:
-            with urllib.request.urlopen(DOCS_URL, timeout=30) as response:
-                print(response.read().decode())
+            with open_url(DOCS_URL) as response:
+                print(read_body(response).decode())
             return
         except urllib.error.URLError as e:
             print(f"Error fetching docs: {e.reason}", file=sys.stderr)
@@ -71,11 +86,11 @@ def main():
         url += "?" + urllib.parse.urlencode(params)
 
     try:
-        with urllib.request.urlopen(url, timeout=30) as response:
-            data = json.load(response)
+        with open_url(url) as response:
+            data = json.loads(read_body(response))
             print(json.dumps(data, indent=2))
     except urllib.error.HTTPError as e:
-        error_body = e.read().decode() if e.fp else ""
+        error_body = read_body(e).decode() if e.fp else ""
         print(json.dumps({"error": str(e), "status": e.code, "body": error_body}), file=sys.stderr)
         sys.exit(1)
     except urllib.error.URLError as e:
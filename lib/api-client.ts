@@ -219,6 +219,15 @@ export class ApiError extends Error {
   }
 }
 
+// Build an ApiError from a failed response's JSON error body
+async function toApiError(response: Response): Promise<ApiError> {
+  const error = await response.json().catch(() => ({
+    code: 'UNKNOWN_ERROR',
+    message: response.statusText,
+  }));
+  return new ApiError(error.message, error.code, response.status);
+}
+
 // Fetch wrapper with error handling
 async function fetchApi<T>(endpoint: string, options?: RequestInit): Promise<T> {
   const url = `${API_BASE_URL}${endpoint}`;
@@ -233,11 +242,7 @@ async function fetchApi<T>(endpoint: string, options?: RequestInit): Promise<T>
   });
 
   if (!response.ok) {
-    const error = await response.json().catch(() => ({
-      code: 'UNKNOWN_ERROR',
-      message: response.statusText,
-    }));
-    throw new ApiError(error.message, error.code, response.status);
+    throw await toApiError(response);
   }
 
   return response.json();
@@ -382,7 +387,23 @@ export async function getFileBackupContent(
   sessionId: string,
   backupFileName: string
 ): Promise<FileBackupContent> {
-  return fetchApi(`/sessions/${sessionId}/file-history/${encodeURIComponent(backupFileName)}`);
+  const url = `${API_BASE_URL}/sessions/${sessionId}/file-history/${encodeURIComponent(backupFileName)}`;
+  const response = await fetch(url, { cache: 'no-store' });
+
+  if (!response.ok) {
+    throw await toApiError(response);
+  }
+
+  // Large backups are streamed as raw bytes rather than wrapped in JSON
+  if (response.headers.get('Content-Type')?.startsWith('application/json')) {
+    return response.json();
+  }
+  const name = response.headers.get('X-Backup-Name');
+  return {
+    backupFileName: name ? decodeURIComponent(name) : backupFileName,
+    content: await response.text(),
+    size: Number(response.headers.get('X-Backup-Size')),
+  };
 }
 
 export async function getSessionDebugLogs(sessionId: string): Promise<{ data: string[] }> {